@@ -0,0 +1,250 @@
+"""Microbenchmarks for the scraper's hot paths: python benchmark.py [name ...] (all when omitted)"""
+import argparse
+import re
+import time
+import tracemalloc
+from datetime import timedelta
+from sources.base_scraper import LinkFrontier
+from sources.html_engine import ENGINES, class_string, parse_document
+from sources.registry import load_source_configs, get_scraper_class
+
+def _best_of(repeat, func, *args):
+    """Fastest of several runs in milliseconds, to keep scheduler noise out of the comparison"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        elapsed = (time.perf_counter() - start) * 1000
+        best = elapsed if best is None else min(best, elapsed)
+    return best
+
+def _listing_pages(link_count, page_size=30, repeated=6):
+    """Synthetic listing pages: each repeats a few links of the page before, like sidebars and carousels do"""
+    pages = []
+    next_id = 0
+    while next_id < link_count:
+        previous = pages[-1][:repeated] if pages else []
+        fresh = [f"https://example.com/news/{next_id + i}/story-{next_id + i}" for i in range(page_size - len(previous))]
+        next_id += len(fresh)
+        pages.append(fresh + previous)
+    return pages
+
+def _discover_with_lists(pages):
+    """Link discovery as the sources did it: membership tests against growing lists"""
+    links = []
+    for page in pages:
+        new_links = []
+        for href in page:
+            if href not in links and href not in new_links:
+                new_links.append(href)
+        links.extend(new_links)
+    articles = []
+    for link in links:
+        if any(article['url'] == link for article in articles):
+            continue
+        articles.append({'url': link})
+    return len(articles)
+
+def _discover_with_frontier(pages):
+    links = LinkFrontier()
+    for page in pages:
+        new_links = LinkFrontier()
+        for href in page:
+            if href not in links:
+                new_links.add(href)
+        links.extend(new_links)
+    discovered = LinkFrontier()
+    return len(discovered.extend(links))
+
+def bench_frontier(args):
+    """Link de-duplication: list membership (quadratic) against LinkFrontier (linear)"""
+    print(f"{'links':>8} {'lists ms':>10} {'frontier ms':>12} {'speed-up':>9}")
+    for link_count in args.links:
+        pages = _listing_pages(link_count)
+        assert _discover_with_lists(pages) == _discover_with_frontier(pages)
+        lists_ms = _best_of(args.repeat, _discover_with_lists, pages)
+        frontier_ms = _best_of(args.repeat, _discover_with_frontier, pages)
+        print(f"{link_count:>8} {lists_ms:>10.2f} {frontier_ms:>12.2f} {lists_ms / frontier_ms:>8.1f}x")
+
+def _scrapers():
+    """One configured scraper per source name, built lazily"""
+    configs = {source['name']: source for source in load_source_configs()}
+    scrapers = {}
+
+    def scraper_for(name):
+        if name not in scrapers:
+            scrapers[name] = get_scraper_class(configs[name])()
+            scrapers[name].apply_config(configs[name])
+        return scrapers[name]
+    return configs, scraper_for
+
+def _synthetic_pages():
+    """A Sky Sports style listing and article page, padded with the scripts and chrome real pages carry"""
+    chrome = ''.join(f'<nav class="site-nav"><ul>{"".join(f"<li><a href=/nav/{i}>Item {i}</a></li>" for i in range(40))}</ul></nav>'
+                     f'<script>window.analytics_{j} = {{"events": [{", ".join(str(i) for i in range(400))}]}};</script>'
+                     f'<style>.x{j} {{ color: red; }}</style><svg><path d="{"M0 0 L1 1 " * 200}"/></svg>' for j in range(30))
+    cards = ''.join(f'<div class="news-list__item"><a href="/football/news/11095/{13000000 + i}/story-{i}">Story {i}</a>'
+                    f'<span class="news-list__meta"><time datetime="2025-01-01T10:00:00Z">1h</time></span></div>' for i in range(200))
+    body = ''.join(f'<p>Paragraph {i} of the match report describes what happened in detail.</p>' for i in range(60))
+    listing = f'<html><head><title>Football news</title></head><body>{chrome}<main>{cards}</main>{chrome}</body></html>'
+    article = (f'<html><head><title>Report</title><meta property="article:published_time" content="2025-01-01T10:00:00Z">'
+               f'<script type="application/ld+json">{{"@type": "NewsArticle", "headline": "Report"}}</script></head>'
+               f'<body>{chrome}<div class="sdc-article-body article__body"><h1 class="article__headline">Report of the weekend match</h1>'
+               f'<time datetime="2025-01-01T10:00:00Z">1h</time>{body}</div>{chrome}</body></html>')
+    return [('Sky Sports', 'https://www.skysports.com/football/news/', listing),
+            ('Sky Sports', 'https://www.skysports.com/football/news/11095/13000001/story-1', article)]
+
+def _synthetic_cnbc_listing():
+    """A CNBC style listing: River and Card markup among a few thousand elements of page chrome"""
+    banner = ''.join(f'<li class="MarketsBanner-item"><span class="MarketCard-symbol">S{j}</span>'
+                     f'<span class="MarketCard-changes">+0.{j}%</span></li>' for j in range(10))
+    chrome = ''.join(f'<div class="PageBuilder-col-{i % 12} PageBuilder-containerFluidWidths">'
+                     f'<ul class="MarketsBanner-list">{banner}</ul></div>' for i in range(60))
+    cards = ''.join(f'<div class="Card-standardBreakerCard Card-card Card-rectangleToLeftSquareMedia"><div class="Card-cardInfo">'
+                    f'<div class="Card-titleContainer"><a class="Card-title" href="https://www.cnbc.com/2025/01/01/story-{i}.html">'
+                    f'<div>Story {i}</div></a></div><span class="Card-time">{i % 5 + 1} hours ago</span></div>'
+                    f'<div class="Card-mediaContainer"><img class="Card-mediaImage" src="/img/{i}.jpg"></div></div>'
+                    f'<div class="RiverPlusCard-container"><div class="RiverHeadline-headline RiverHeadline-hasThumbnail">'
+                    f'<a href="https://www.cnbc.com/2025/01/01/river-{i}.html">River {i}</a></div></div>' for i in range(120))
+    return f'<html><head><title>Sports</title></head><body>{chrome}<div class="PageBuilder-pageWrapper">{cards}</div>{chrome}</body></html>'
+
+def _peak_kib(func, *args):
+    tracemalloc.start()
+    try:
+        result = func(*args)
+        return tracemalloc.get_traced_memory()[1] / 1024, result
+    finally:
+        tracemalloc.stop()
+
+def _archived_pages(args, configs):
+    """(source, url, html) of the newest archived pages, or synthetic ones when nothing is recorded"""
+    pages = []
+    try:
+        from page_store import PageStore
+        pages = [(source, url, html) for url, source, html in PageStore().latest_pages(args.source, args.pages)]
+    except Exception as e:
+        print(f"Page store unavailable: {str(e)}")
+    pages = [page for page in pages if page[0] in configs]
+    if not pages:
+        print("No archived pages (record some with: python main.py --record); using synthetic pages")
+        pages = _synthetic_pages()
+    return pages
+
+def bench_parse(args):
+    """BeautifulSoup parsing of archived pages (the legacy "soup" engine): html.parser, lxml, and lxml with strainers"""
+    configs, scraper_for = _scrapers()
+    pages = _archived_pages(args, configs)
+    variants = [('html.parser', {'parser': 'html.parser', 'strain': False}),
+                ('lxml', {'parser': 'lxml', 'strain': False}),
+                ('lxml+strainer', {'parser': 'lxml', 'strain': True})]
+    print(f"{len(pages)} pages, {sum(len(html) for _, _, html in pages) / 1024 / 1024:.1f} MB of HTML")
+    print(f"{'variant':<15} {'listing ms':>11} {'article ms':>11} {'peak KiB':>10} {'elements':>9}")
+    for label, overrides in variants:
+        totals = {True: 0.0, False: 0.0}
+        peak = 0
+        elements = 0
+        for source, url, html in pages:
+            scraper = scraper_for(source)
+            scraper.config = dict(configs[source], **overrides)
+            scraper._strainers = None
+            listing = not re.match(scraper.article_url_pattern, url)
+            totals[listing] += _best_of(args.repeat, scraper.make_soup, html, listing)
+            page_peak, soup = _peak_kib(scraper.make_soup, html, listing)
+            peak = max(peak, page_peak)
+            elements += len(soup.find_all(True))
+        print(f"{label:<15} {totals[True]:>11.1f} {totals[False]:>11.1f} {peak:>10.0f} {elements:>9}")
+
+def _listing_cards(scraper, document):
+    """(article link, card date) of every card on a listing page, read through the source's profile"""
+    return [(href, scraper.card_published_at(card)) for href, card in scraper.listing_links(document)]
+
+def _extract(scraper, url, html, listing):
+    """What a scraper takes from one page: its cards, or the fields of its article"""
+    if listing:
+        return _listing_cards(scraper, scraper.make_document(html, listing))
+    # Served to _get_soup() as an already downloaded page, so nothing goes over the network
+    scraper._prefetched[url] = html
+    article = scraper.scrape_article_content(url) or {}
+    return tuple(article.get(field) for field in ('title', 'content', 'published_at'))
+
+def bench_cards(args):
+    """Listing card matching on recorded CNBC pages: the old regex alternation against compiled class tokens"""
+    configs, scraper_for = _scrapers()
+    source = args.source or 'CNBC'
+    scraper = scraper_for(source)
+    pages = [(url, html) for page_source, url, html in _archived_pages(args, configs)
+             if page_source == source and not re.match(scraper.article_url_pattern, url)]
+    if not pages:
+        print(f"No recorded {source} listing pages; using a synthetic CNBC style listing")
+        scraper = scraper_for('CNBC')
+        pages = [('https://www.cnbc.com/sports/', _synthetic_cnbc_listing())]
+    matcher = scraper.card_matcher
+    pattern = re.compile('|'.join(map(re.escape, sorted(matcher.names))))
+    soups = [scraper.make_soup(html) for _, html in pages]
+    variants = [('regex (soup)', soups, lambda soup: soup.find_all(list(matcher.tags), class_=pattern)),
+                ('tokens (soup)', soups, matcher.select)]
+    for engine in ENGINES:
+        variants.append((f'tokens ({engine})', [parse_document(html, engine) for _, html in pages], matcher.select))
+    print(f"{len(pages)} {source} listing pages, {len(matcher.names)} card classes")
+    print(f"{'variant':<16} {'ms':>8} {'cards':>6}")
+    expected = None
+    for label, documents, match in variants:
+        found = [[class_string(card) for card in match(document)] for document in documents]
+        expected = expected or found
+        assert found == expected, f"{label} found different cards"
+        elapsed = _best_of(args.repeat, lambda: [match(document) for document in documents])
+        print(f"{label:<16} {elapsed:>8.2f} {sum(len(cards) for cards in found):>6}")
+
+def bench_engines(args):
+    """Extraction on archived pages with each HTML engine, checked for parity with BeautifulSoup"""
+    configs, scraper_for = _scrapers()
+    pages = _archived_pages(args, configs)
+    engines = ['soup'] + list(ENGINES)
+    print(f"{len(pages)} pages; engines: {', '.join(engines)}")
+    print(f"{'engine':<8} {'listing ms':>11} {'article ms':>11} {'mismatches':>11}")
+    expected = {}
+    for engine in engines:
+        totals = {True: 0.0, False: 0.0}
+        mismatches = []
+        for source, url, html in pages:
+            scraper = scraper_for(source)
+            # Static fetches only, and no recency cut, so archived articles are extracted in full
+            scraper.config = dict(configs[source], engine=engine, fetch_mode='static')
+            scraper.recency_window = timedelta(days=365 * 100)
+            listing = not re.match(scraper.article_url_pattern, url)
+            result = _extract(scraper, url, html, listing)
+            totals[listing] += _best_of(args.repeat, _extract, scraper, url, html, listing)
+            if engine == 'soup':
+                expected[url] = result
+            elif result != expected[url]:
+                mismatches.append(url)
+        print(f"{engine:<8} {totals[True]:>11.1f} {totals[False]:>11.1f} {len(mismatches):>11}")
+        for url in mismatches[:5]:
+            print(f"  differs from soup: {url}")
+
+BENCHMARKS = {
+    'frontier': bench_frontier,
+    'parse': bench_parse,
+    'engines': bench_engines,
+    'cards': bench_cards,
+}
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the scraper microbenchmarks")
+    parser.add_argument("names", nargs="*", help=f"benchmarks to run, from {', '.join(BENCHMARKS)} (default: all)")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per measurement, the fastest is reported")
+    parser.add_argument("--links", type=int, nargs="+", default=[500, 1000, 2000, 5000, 10000],
+                        help="link counts for the frontier benchmark")
+    parser.add_argument("--pages", type=int, default=200, help="archived pages the parse and engine benchmarks use")
+    parser.add_argument("--source", help="only use archived pages of this source (config.json name)")
+    args = parser.parse_args()
+    unknown = [name for name in args.names if name not in BENCHMARKS]
+    if unknown:
+        parser.error(f"unknown benchmark: {', '.join(unknown)}")
+    return args
+
+if __name__ == "__main__":
+    args = parse_args()
+    for name in args.names or BENCHMARKS:
+        print(f"== {name}: {BENCHMARKS[name].__doc__}")
+        BENCHMARKS[name](args)
@@ -1,13 +1,17 @@
-from pymongo import MongoClient
-from pymongo.errors import ServerSelectionTimeoutError, ConnectionFailure
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import ServerSelectionTimeoutError, ConnectionFailure, BulkWriteError, OperationFailure
+from pymongo.monitoring import ConnectionPoolListener
 from contextlib import contextmanager
+from collections import deque
 from dotenv import load_dotenv
 import os
 import logging
+import threading
 from datetime import datetime
 import json
 import time
 from urllib.parse import quote_plus
+from state import ProcessLocal
 
 load_dotenv()
 
@@ -15,6 +19,84 @@ MONGO_URI = os.getenv("MONGO_URI")
 MONGO_TIMEOUT = 10000  # 10 seconds timeout
 MAX_RETRIES = 3
 RETRY_DELAY = 2  # seconds
+LATENCY_SAMPLES = 500  # Number of recent operation timings kept per operation
+DUPLICATE_KEY_ERROR = 11000
+
+class PoolMonitor(ConnectionPoolListener):
+    """Track connection pool activity for the health endpoint"""
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        self.created = 0
+        self.closed = 0
+        self.checked_out = 0
+        self.checkout_failures = 0
+        self.pool_clears = 0
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        pass
+
+    def pool_cleared(self, event):
+        with self.lock:
+            self.pool_clears += 1
+
+    def pool_closed(self, event):
+        pass
+
+    def connection_created(self, event):
+        with self.lock:
+            self.created += 1
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        with self.lock:
+            self.closed += 1
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        with self.lock:
+            self.checkout_failures += 1
+
+    def connection_checked_out(self, event):
+        with self.lock:
+            self.checked_out += 1
+
+    def connection_checked_in(self, event):
+        with self.lock:
+            self.checked_out -= 1
+
+    def snapshot(self):
+        with self.lock:
+            return {
+                "open_connections": self.created - self.closed,
+                "in_use": self.checked_out,
+                "created": self.created,
+                "closed": self.closed,
+                "checkout_failures": self.checkout_failures,
+                "pool_clears": self.pool_clears
+            }
+
+_pool_monitor = PoolMonitor()
+_op_latencies = {}
+
+def _reset_after_fork():
+    """Drop the parent's client in a forked child; MongoClient is not fork-safe"""
+    _client.reset()
+    _pool_monitor.lock = threading.Lock()
+    _pool_monitor.reset()
+    _op_latencies.clear()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_after_fork)
 
 def get_mongo_client():
     """Create MongoDB client with retry mechanism"""
@@ -40,7 +122,8 @@ def get_mongo_client():
                 maxIdleTimeMS=30000,
                 waitQueueTimeoutMS=10000,
                 retryWrites=True,
-                retryReads=True
+                retryReads=True,
+                event_listeners=[_pool_monitor]
             )
             # Test connection
             client.server_info()
@@ -57,20 +140,85 @@ def get_mongo_client():
             logging.error(f"Unexpected error connecting to MongoDB: {str(e)}")
             raise
 
+def _close(client):
+    client.close()
+    logging.info("MongoDB connection closed")
+
+_client = ProcessLocal(get_mongo_client, on_exit=_close)
+
+def get_client():
+    """Return the process-wide MongoClient, creating it on first use"""
+    return _client.get()
+
+def close_client():
+    """Close the process-wide client (called automatically at exit)"""
+    _client.close()
+
 @contextmanager
 def get_db():
-    client = None
     try:
-        client = get_mongo_client()
-        db = client["news_scraper"]
-        yield db
+        yield get_client()["news_scraper"]
     except Exception as e:
         logging.error(f"Database error: {str(e)}")
         raise
+
+@contextmanager
+def timed_operation(name):
+    """Record the wall-clock latency of a database operation"""
+    start = time.perf_counter()
+    try:
+        yield
     finally:
-        if client:
-            client.close()
-            logging.info("MongoDB connection closed")
+        samples = _op_latencies.setdefault(name, deque(maxlen=LATENCY_SAMPLES))
+        samples.append((time.perf_counter() - start) * 1000)
+
+def _summarize_latencies(samples):
+    ordered = sorted(samples)
+    return {
+        "count": len(ordered),
+        "avg_ms": round(sum(ordered) / len(ordered), 2),
+        "p50_ms": round(ordered[len(ordered) // 2], 2),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 2),
+        "max_ms": round(ordered[-1], 2)
+    }
+
+def get_pool_health():
+    """Report connection pool state, a live ping round-trip and recent operation latencies"""
+    health = {"pid": os.getpid(), "pool": _pool_monitor.snapshot(), "operations": {}}
+    try:
+        start = time.perf_counter()
+        get_client().admin.command("ping")
+        health["ping_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        health["status"] = "healthy"
+    except Exception as e:
+        logging.error(f"MongoDB health check failed: {str(e)}")
+        health["status"] = "unhealthy"
+        health["error"] = str(e)
+    for name, samples in list(_op_latencies.items()):
+        if samples:
+            health["operations"][name] = _summarize_latencies(samples)
+    return health
+
+def ensure_indexes():
+    """Create the indexes the scraper relies on (safe to call on every startup)"""
+    with get_db() as db:
+        try:
+            db.articles.create_index("url", unique=True, name="url_unique")
+            db.scraping_status.create_index("source", unique=True, name="source_unique")
+            logging.info("MongoDB indexes are in place")
+            return True
+        except OperationFailure as e:
+            # Usually pre-existing duplicate URLs; bulk upserts still dedupe by URL without it
+            logging.error(f"Could not create MongoDB indexes: {str(e)}")
+            return False
+
+def iter_article_urls(after_id=None):
+    """Yield (_id, url) of stored articles in insertion order, optionally only those newer than after_id"""
+    query = {"_id": {"$gt": after_id}} if after_id is not None else {}
+    with get_db() as db, timed_operation("iter_article_urls"):
+        for doc in db.articles.find(query, {"url": 1}).sort("_id", 1).batch_size(10000):
+            if doc.get("url"):
+                yield doc["_id"], doc["url"]
 
 def check_existing_articles():
     with get_db() as db:
@@ -92,7 +240,7 @@ def save_article(article):
     retries = 0
     while retries < MAX_RETRIES:
         try:
-            with get_db() as db:
+            with get_db() as db, timed_operation("save_article"):
                 # Log article details
                 logging.info(f"Article details: title='{article.get('title', 'no title')}', "
                             f"source='{article.get('source', 'no source')}', "
@@ -136,11 +284,62 @@ def save_article(article):
             logging.error(f"Article data: {json.dumps(article, default=str)}")
             return False
 
+def save_articles(batch):
+    """Insert a batch of articles with one unordered bulk upsert keyed by URL"""
+    result = {"inserted": 0, "duplicates": 0, "failed": 0}
+    # Collapse repeated URLs inside the batch so each one is a single upsert
+    unique_articles = {}
+    for article in batch:
+        if article.get("url"):
+            unique_articles.setdefault(article["url"], article)
+        else:
+            result["failed"] += 1
+    result["duplicates"] += len(batch) - result["failed"] - len(unique_articles)
+    if not unique_articles:
+        return result
+
+    operations = [
+        UpdateOne({"url": url}, {"$setOnInsert": article}, upsert=True)
+        for url, article in unique_articles.items()
+    ]
+    retries = 0
+    while retries < MAX_RETRIES:
+        try:
+            with get_db() as db, timed_operation("save_articles"):
+                bulk = db.articles.bulk_write(operations, ordered=False)
+            result["inserted"] += bulk.upserted_count
+            result["duplicates"] += bulk.matched_count
+            break
+        except BulkWriteError as e:
+            details = e.details
+            # Concurrent writers can race on the unique index; those losers are duplicates too
+            duplicate_errors = sum(1 for err in details.get("writeErrors", []) if err.get("code") == DUPLICATE_KEY_ERROR)
+            result["inserted"] += details.get("nUpserted", 0)
+            result["duplicates"] += details.get("nMatched", 0) + duplicate_errors
+            result["failed"] += len(details.get("writeErrors", [])) - duplicate_errors
+            if result["failed"]:
+                logging.error(f"Bulk save reported {result['failed']} failed writes: {details.get('writeErrors', [])[:3]}")
+            break
+        except (ServerSelectionTimeoutError, ConnectionFailure) as e:
+            retries += 1
+            if retries == MAX_RETRIES:
+                logging.error(f"Failed to save batch of {len(operations)} articles after {MAX_RETRIES} attempts: {str(e)}")
+                result["failed"] += len(operations)
+                break
+            logging.warning(f"Database connection attempt {retries} failed: {str(e)}. Retrying in {RETRY_DELAY} seconds...")
+            time.sleep(RETRY_DELAY)
+        except Exception as e:
+            logging.error(f"Error saving batch of {len(operations)} articles: {str(e)}")
+            result["failed"] += len(operations)
+            break
+    logging.info(f"Saved batch: {result['inserted']} inserted, {result['duplicates']} duplicates, {result['failed']} failed")
+    return result
+
 def get_last_scrape_time(source_name):
     with get_db() as db:
         try:
             status = db.scraping_status.find_one({"source": source_name})
-            return status["last_scrape"] if status else None
+            return status.get("last_scrape") if status else None
         except Exception as e:
             logging.error(f"Error getting last scrape time: {str(e)}")
             return None
@@ -158,6 +357,32 @@ def update_scrape_time(source_name):
             logging.error(f"Error updating scrape time: {str(e)}")
             return False
 
+def get_section_marks(source_name):
+    """High-water marks of a source's sections: {section_url: {"links": [...], "updated": datetime}}"""
+    with get_db() as db:
+        try:
+            status = db.scraping_status.find_one({"source": source_name}, {"sections": 1})
+            sections = status.get("sections", []) if status else []
+            return {mark["section"]: {"links": mark.get("links", []), "updated": mark.get("updated")} for mark in sections}
+        except Exception as e:
+            logging.error(f"Error getting section marks: {str(e)}")
+            return {}
+
+def update_section_marks(source_name, marks):
+    """Replace a source's section high-water marks (stored as a list, section URLs are not valid field names)"""
+    sections = [{"section": section, "links": mark["links"], "updated": mark["updated"]} for section, mark in marks.items()]
+    with get_db() as db:
+        try:
+            db.scraping_status.update_one(
+                {"source": source_name},
+                {"$set": {"source": source_name, "sections": sections}},
+                upsert=True
+            )
+            return True
+        except Exception as e:
+            logging.error(f"Error updating section marks: {str(e)}")
+            return False
+
 def get_scraping_stats():
     with get_db() as db:
         try:
@@ -167,7 +392,7 @@ def get_scraping_stats():
             }
             for source in db.scraping_status.find():
                 stats["sources"][source["source"]] = {
-                    "last_scrape": source["last_scrape"],
+                    "last_scrape": source.get("last_scrape"),
                     "article_count": db.articles.count_documents({"source": source["source"]})
                 }
             return stats
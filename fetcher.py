@@ -0,0 +1,112 @@
+import asyncio
+import concurrent.futures
+import logging
+import os
+import threading
+from collections import Counter
+from urllib.parse import urlparse
+import aiohttp
+from rate_limiter import get_rate_limiter
+from page_store import replaying, record_page, replay_page
+from state import ProcessLocal
+
+# Concurrent connections to one host and in total
+PER_HOST_CONNECTIONS = int(os.getenv("FETCH_PER_HOST", "4"))
+TOTAL_CONNECTIONS = int(os.getenv("FETCH_TOTAL", "32"))
+REQUEST_TIMEOUT = 30
+MAX_RETRIES = 3
+RETRY_DELAY = 2
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+class AsyncFetcher:
+    """Download pages concurrently on a background event loop, paced by the shared rate limiter over keep-alive connections"""
+    def __init__(self, per_host=PER_HOST_CONNECTIONS, total=TOTAL_CONNECTIONS, timeout=REQUEST_TIMEOUT,
+                 retries=MAX_RETRIES):
+        self.per_host = per_host
+        self.total = total
+        self.timeout = timeout
+        self.retries = retries
+        self.stats = Counter()
+        self._session = None
+        self._host_slots = {}
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="async-fetcher", daemon=True)
+        self._thread.start()
+
+    def _get_session(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.total, limit_per_host=self.per_host,
+                                             ttl_dns_cache=300, keepalive_timeout=30)
+            self._session = aiohttp.ClientSession(connector=connector,
+                                                  timeout=aiohttp.ClientTimeout(total=self.timeout))
+        return self._session
+
+    async def _fetch(self, url, headers, source=None):
+        host = urlparse(url).netloc
+        slots = self._host_slots.setdefault(host, asyncio.Semaphore(self.per_host))
+        session = self._get_session()
+        limiter = get_rate_limiter()
+        for attempt in range(self.retries):
+            async with slots:
+                # Throttling answers pause the whole domain in the limiter, so retries wait there
+                await limiter.acquire_async(url)
+                try:
+                    async with session.get(url, headers=headers) as response:
+                        await limiter.record_async(url, response.status, response.headers.get('Retry-After'))
+                        if response.status in RETRY_STATUSES:
+                            raise aiohttp.ClientResponseError(response.request_info, response.history,
+                                                              status=response.status, message=response.reason)
+                        response.raise_for_status()
+                        text = await response.text(errors='replace')
+                        self.stats["fetched"] += 1
+                        self.stats["bytes"] += len(text)
+                        record_page(url, text, 'static', source)
+                        return text
+                except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                    self.stats["errors"] += 1
+                    logging.warning(f"[AsyncFetcher] Error fetching {url} (attempt {attempt + 1}/{self.retries}): {str(e) or type(e).__name__}")
+                    status = getattr(e, 'status', None)
+                    if status and status not in RETRY_STATUSES:
+                        break
+            if attempt < self.retries - 1:
+                await asyncio.sleep(RETRY_DELAY * (attempt + 1))
+        self.stats["failed"] += 1
+        return None
+
+    def submit(self, url, headers=None, source=None):
+        """Start downloading url; returns a concurrent.futures.Future of its HTML (None on failure)"""
+        self.stats["submitted"] += 1
+        if replaying():
+            future = concurrent.futures.Future()
+            future.set_result(replay_page(url, 'static'))
+            return future
+        return asyncio.run_coroutine_threadsafe(self._fetch(url, headers, source), self._loop)
+
+    def fetch_many(self, urls, headers=None):
+        """Download a batch of URLs concurrently; returns {url: html or None}"""
+        futures = {url: self.submit(url, headers) for url in dict.fromkeys(urls)}
+        return {url: future.result() for url, future in futures.items()}
+
+    def close(self):
+        async def shutdown():
+            if self._session is not None:
+                await self._session.close()
+        try:
+            asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result(timeout=10)
+        except Exception:
+            pass
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout=10)
+
+def _shut_down(fetcher):
+    logging.info(f"[AsyncFetcher] Shutting down: {dict(fetcher.stats)}")
+    fetcher.close()
+
+_fetcher = ProcessLocal(AsyncFetcher, on_exit=_shut_down)
+
+def get_fetcher():
+    """Return this process's async fetcher, creating it on first use"""
+    return _fetcher.get()
+
+def close_fetcher():
+    _fetcher.close()
@@ -0,0 +1,73 @@
+import logging
+import threading
+import time
+from rate_limiter import domain_of
+from state import state_path, load_json, save_json, ProcessLocal
+
+# Validators unused for this long are dropped when the cache is saved
+VALIDATOR_TTL = 7 * 24 * 3600
+
+class PageNotModified(Exception):
+    """The server answered 304: the page is unchanged since it was last fetched"""
+
+class ValidatorCache:
+    """ETag / Last-Modified validators per URL, persisted per domain between runs"""
+    def __init__(self):
+        self._domains = {}
+        self._dirty = set()
+        self._lock = threading.Lock()
+
+    def _entries(self, domain):
+        if domain not in self._domains:
+            self._domains[domain] = load_json(state_path('http_validators', f'{domain}.json'), {})
+        return self._domains[domain]
+
+    def conditional_headers(self, url):
+        """If-None-Match / If-Modified-Since headers for url, empty when it was never fetched"""
+        with self._lock:
+            entry = self._entries(domain_of(url)).get(url)
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def remember(self, url, response_headers):
+        """Store the validators of a 200 response; servers that send none are simply not cached"""
+        etag = response_headers.get('ETag')
+        last_modified = response_headers.get('Last-Modified')
+        domain = domain_of(url)
+        with self._lock:
+            entries = self._entries(domain)
+            if etag or last_modified:
+                entries[url] = {'etag': etag, 'last_modified': last_modified, 'stored': time.time()}
+                self._dirty.add(domain)
+            elif entries.pop(url, None):
+                self._dirty.add(domain)
+
+    def touch(self, url):
+        """Keep a validator alive after a 304 confirmed it"""
+        with self._lock:
+            entry = self._entries(domain_of(url)).get(url)
+            if entry:
+                entry['stored'] = time.time()
+                self._dirty.add(domain_of(url))
+
+    def save(self):
+        cutoff = time.time() - VALIDATOR_TTL
+        with self._lock:
+            for domain in self._dirty:
+                entries = {url: entry for url, entry in self._domains[domain].items() if entry['stored'] >= cutoff}
+                try:
+                    save_json(state_path('http_validators', f'{domain}.json'), entries)
+                except OSError as e:
+                    logging.error(f"[ValidatorCache] Could not save validators for {domain}: {str(e)}")
+            self._dirty.clear()
+
+_cache = ProcessLocal(ValidatorCache, on_exit=ValidatorCache.save)
+
+def get_validator_cache():
+    """Return this process's validator cache, loading domains on first use"""
+    return _cache.get()
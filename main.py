@@ -1,20 +1,76 @@
+import argparse
 import json
-import importlib
 import logging
+import multiprocessing
+import os
+import queue
 import signal
 import sys
+import threading
 import time
-from database import save_article, get_last_scrape_time, update_scrape_time, get_scraping_stats, check_existing_articles
-from pathlib import Path
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+from database import save_articles, ensure_indexes, get_last_scrape_time, update_scrape_time, get_scraping_stats, check_existing_articles, get_pool_health
+from sources.registry import load_source_configs, open_scraper, source_id
+from page_store import page_store_mode, set_page_store_mode, replaying, get_page_store, ReplaySink, REPLAY_OUTPUT_DIR
+from seen_index import refresh_seen_index
+from state import SCRAPER_WORKERS
 from datetime import datetime, timedelta
 
 # Global flag for graceful shutdown
 should_exit = False
+# Shared with worker processes so a shutdown reaches sources that are already running
+_exit_event = None
+# Number of articles written per bulk upsert
+SAVE_BATCH_SIZE = 100
+# Longest time a partial batch waits in memory before it is written
+SAVE_FLUSH_INTERVAL = 5
+# Scraped articles buffered between a scraper and its saver; a full queue pauses the scraper
+ARTICLE_QUEUE_SIZE = 200
+# Marks the end of a source's article stream
+_END_OF_STREAM = object()
+# Default wall-clock budget per source in seconds, overridable with "time_budget" in config.json
+SOURCE_TIME_BUDGET = int(os.getenv("SOURCE_TIME_BUDGET", "1800"))
+
+class SourceTimeout(BaseException):
+    """Raised inside a source run when its wall-clock budget is used up"""
 
 def signal_handler(signum, frame):
     global should_exit
     logging.info("Received shutdown signal, finishing current task...")
     should_exit = True
+    if _exit_event is not None:
+        _exit_event.set()
+
+def _worker_signal_handler(signum, frame):
+    """Stop this worker only: a broken pool terminates its surviving workers, which must not stop the whole run"""
+    global should_exit
+    logging.info("Received shutdown signal, finishing current task...")
+    should_exit = True
+
+def exit_requested():
+    return should_exit or (_exit_event is not None and _exit_event.is_set())
+
+def _budget_exceeded(signum, frame):
+    raise SourceTimeout()
+
+def setup_logging():
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(processName)s - %(levelname)s - %(message)s',
+        handlers=[
+            logging.FileHandler('scraper.log', encoding='utf-8'),
+            logging.StreamHandler(sys.stdout)
+        ]
+    )
+
+def _init_worker(exit_event):
+    """Prepare a pool process: logging, shutdown flag and signal handlers"""
+    global _exit_event
+    _exit_event = exit_event
+    setup_logging()
+    signal.signal(signal.SIGINT, _worker_signal_handler)
+    signal.signal(signal.SIGTERM, _worker_signal_handler)
 
 def should_scrape_source(source_name):
     last_scrape = get_last_scrape_time(source_name)
@@ -23,15 +79,250 @@ def should_scrape_source(source_name):
     # Scrape if last scrape was more than 15 minutes ago
     return datetime.utcnow() - last_scrape > timedelta(minutes=15)
 
+def _save_from_queue(article_queue, result, start, save=save_articles):
+    """Drain scraped articles from the queue into MongoDB (or a replay's sink) in bulk batches"""
+    batch = []
+    last_flush = time.time()
+
+    def flush():
+        nonlocal batch, last_flush
+        if batch:
+            try:
+                saved = save(batch)
+                result["saved"] += saved["inserted"]
+                if saved["inserted"] and result["first_saved_after"] is None:
+                    result["first_saved_after"] = round(time.time() - start, 1)
+            except Exception as e:
+                logging.error(f"Error saving articles: {str(e)}")
+        batch = []
+        last_flush = time.time()
+
+    while True:
+        try:
+            item = article_queue.get(timeout=SAVE_FLUSH_INTERVAL)
+        except queue.Empty:
+            item = None
+        if item is _END_OF_STREAM:
+            flush()
+            return
+        if item is not None:
+            batch.append(item)
+        if len(batch) >= SAVE_BATCH_SIZE or time.time() - last_flush >= SAVE_FLUSH_INTERVAL:
+            flush()
+
+def scrape_source(source):
+    """Scrape and save one source within its time budget, returning a summary"""
+    budget = source.get("time_budget", SOURCE_TIME_BUDGET)
+    result = {"source": source["name"], "found": 0, "saved": 0, "status": "ok", "duration": 0.0,
+              "first_saved_after": None}
+    start = time.time()
+    # Articles are saved by a separate thread while the scraper keeps producing them
+    article_queue = queue.Queue(maxsize=ARTICLE_QUEUE_SIZE)
+    # A replay is an offline run: its articles go to a JSON-lines file, never to the database
+    save = ReplaySink(source_id(source)).save_articles if replaying() else save_articles
+    saver = threading.Thread(target=_save_from_queue, args=(article_queue, result, start, save),
+                             name=f"saver-{source_id(source)}", daemon=True)
+    saver.start()
+    # SIGALRM enforces the budget even while a scraper is blocked inside a page load
+    previous_handler = signal.signal(signal.SIGALRM, _budget_exceeded)
+    signal.alarm(int(budget))
+    try:
+        logging.info(f"Starting scrape for {source['name']} (budget {budget}s)")
+        # The scraper (and any browser it needs) only exists for the duration of this block
+        with open_scraper(source) as scraper:
+            try:
+                # Stream articles with retry logic; a retry only happens if nothing was produced yet
+                max_retries = 3
+                retry_delay = 5
+                for attempt in range(max_retries):
+                    if exit_requested():
+                        break
+                    articles = scraper.iter_articles()
+                    try:
+                        for article in articles:
+                            if exit_requested():
+                                break
+                            if result["found"] == 0:
+                                logging.info(f"First article sample: {json.dumps(article, default=str)}")
+                            result["found"] += 1
+                            article_queue.put(article)
+                        break
+                    except Exception as e:
+                        logging.error(f"Error scraping {source['name']} (attempt {attempt + 1}/{max_retries}): {str(e)}")
+                        if result["found"] or attempt == max_retries - 1:
+                            break
+                        time.sleep(retry_delay * (attempt + 1))
+                    finally:
+                        articles.close()
+            finally:
+                # The budget ends here: close() must quit browsers and save state without being interrupted
+                signal.alarm(0)
+    except SourceTimeout:
+        logging.error(f"Time budget of {budget}s exceeded for {source['name']}, stopping it")
+        result["status"] = "timeout"
+    except Exception as e:
+        logging.error(f"Error processing source {source['name']}: {str(e)}")
+        result["status"] = "error"
+        result["error"] = str(e)
+    finally:
+        signal.alarm(0)
+        signal.signal(signal.SIGALRM, previous_handler)
+        article_queue.put(_END_OF_STREAM)
+        saver.join()
+        result["duration"] = round(time.time() - start, 1)
+
+    logging.info(f"Found {result['found']} articles for {source['name']}")
+    if result["found"] == 0 and result["status"] == "ok":
+        result["status"] = "empty"
+    # Update scrape time only if we successfully scraped and saved articles
+    if result["saved"] > 0 and replaying():
+        logging.info(f"Replayed {source['name']}: {result['saved']} articles written to the replay output")
+    elif result["saved"] > 0:
+        try:
+            update_scrape_time(source["name"])
+        except Exception as e:
+            logging.error(f"Error updating scrape time for {source['name']}: {str(e)}")
+        logging.info(f"Completed scraping {source['name']}. Saved {result['saved']} new articles "
+                     f"(first saved after {result['first_saved_after']}s).")
+    else:
+        logging.warning(f"No new articles saved for {source['name']}")
+    return result
+
+def run_sources_serial(sources):
+    results = []
+    for source in sources:
+        if exit_requested():
+            logging.info("Graceful shutdown initiated, exiting...")
+            break
+        results.append(scrape_source(source))
+    return results
+
+def _source_result(future, source):
+    """Result of a finished source future, or a crashed result when its worker raised or died"""
+    try:
+        result = future.result()
+    except Exception as e:
+        logging.error(f"Worker for {source['name']} crashed: {str(e)}")
+        result = {"source": source["name"], "found": 0, "saved": 0, "status": "crashed", "duration": 0.0,
+                  "first_saved_after": None}
+    logging.info(f"Finished {result['source']}: {result['status']}, {result['saved']} saved in {result['duration']}s")
+    return result
+
+def _new_pool(workers, context):
+    return ProcessPoolExecutor(max_workers=workers, mp_context=context,
+                               initializer=_init_worker, initargs=(_exit_event,))
+
+def _run_pool(sources, workers, context, results):
+    """Run sources in one shared process pool; returns the sources left unfinished when a worker death broke it"""
+    unfinished = []
+    with _new_pool(workers, context) as executor:
+        futures = {executor.submit(scrape_source, source): source for source in sources}
+        pending = set(futures)
+        while pending:
+            done, pending = wait(pending, timeout=1, return_when=FIRST_COMPLETED)
+            for future in done:
+                if future.cancelled():
+                    continue
+                if isinstance(future.exception(), BrokenProcessPool):
+                    # Every queued and running source fails with the pool, not only the one whose worker died
+                    unfinished.append(futures[future])
+                    continue
+                results.append(_source_result(future, futures[future]))
+            if exit_requested() and pending:
+                logging.info("Graceful shutdown initiated, cancelling sources that have not started...")
+                for future in pending:
+                    future.cancel()
+                pending = {future for future in pending if not future.cancelled()}
+    return unfinished
+
+def _run_isolated(sources, workers, context, results):
+    """Run each source in a process of its own, so a worker death fails only the source that caused it"""
+    queued = list(sources)
+    running = {}
+    while queued or running:
+        while queued and len(running) < workers and not exit_requested():
+            source = queued.pop(0)
+            executor = _new_pool(1, context)
+            running[executor.submit(scrape_source, source)] = (source, executor)
+        if exit_requested() and queued:
+            logging.info("Graceful shutdown initiated, cancelling sources that have not started...")
+            queued = []
+        done, _ = wait(running, timeout=1, return_when=FIRST_COMPLETED)
+        for future in done:
+            source, executor = running.pop(future)
+            executor.shutdown()
+            results.append(_source_result(future, source))
+
+def run_sources_concurrent(sources, workers):
+    """Run each source in a pool process and collect results as they finish"""
+    global _exit_event
+    # Spawned workers keep Chrome-heavy scrapers apart: no shared GIL and no inherited sockets
+    context = multiprocessing.get_context("spawn")
+    _exit_event = context.Event()
+    results = []
+    unfinished = _run_pool(sources, workers, context, results)
+    if unfinished and not exit_requested():
+        logging.warning(f"A worker died and broke the process pool, rerunning {len(unfinished)} unfinished "
+                        f"sources in processes of their own")
+        _run_isolated(unfinished, workers, context, results)
+    return results
+
+def log_session_summary(results, wall_time):
+    serial_time = sum(result["duration"] for result in results)
+    for result in sorted(results, key=lambda r: r["duration"], reverse=True):
+        logging.info(f"  {result['source']}: {result['status']}, {result['found']} found, "
+                     f"{result['saved']} saved, {result['duration']}s")
+    if wall_time > 0:
+        logging.info(f"Session wall time {wall_time:.1f}s vs {serial_time:.1f}s of source time "
+                     f"(speedup {serial_time / wall_time:.2f}x over serial)")
+
+def run_sources(sources):
+    """Scrape sources, in worker processes when there are several, and return the number saved"""
+    session_start = time.time()
+    workers = min(SCRAPER_WORKERS, len(sources))
+    if workers > 1:
+        logging.info(f"Scraping {len(sources)} sources with {workers} worker processes")
+        results = run_sources_concurrent(sources, workers)
+    else:
+        results = run_sources_serial(sources)
+    log_session_summary(results, time.time() - session_start)
+    return sum(result["saved"] for result in results)
+
+def replay_sources():
+    """Re-run every source over the page store, offline: no seen-URL index, section marks or database"""
+    try:
+        logging.info(f"Page store mode: replay, articles are written under {REPLAY_OUTPUT_DIR}")
+        sources = []
+        for source in load_source_configs():
+            if get_page_store().latest_fetch_time(source["name"]) is None:
+                logging.info(f"Skipping {source['name']} - nothing archived to replay")
+            else:
+                sources.append(source)
+        total_articles = run_sources(sources)
+        logging.info(f"Replay completed, {total_articles} articles written")
+    except Exception as e:
+        logging.error(f"Error in replay: {str(e)}")
+
 def main():
     # Set up signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
 
+    if replaying():
+        replay_sources()
+        return
+
+    total_articles_saved = 0
     try:
-        config_path = Path(__file__).parent / "config.json"
-        with open(config_path) as f:
-            sources = json.load(f)
+        sources = load_source_configs()
+
+        ensure_indexes()
+
+        # Workers load this index to skip articles that are already stored
+        try:
+            refresh_seen_index()
+        except Exception as e:
+            logging.error(f"Could not refresh the seen-URL index: {str(e)}")
 
         # Check existing articles
         logging.info("Checking existing articles in database...")
@@ -41,71 +332,19 @@ def main():
         logging.info("Starting scraping session...")
         logging.info(f"Current stats: {stats_before}")
 
-        total_articles_saved = 0
         # Sort sources by last scrape time to prioritize sources that haven't been scraped recently
         sources.sort(key=lambda x: get_last_scrape_time(x["name"]) or datetime.min)
 
+        due_sources = []
         for source in sources:
-            if should_exit:
-                logging.info("Graceful shutdown initiated, exiting...")
-                break
-
-            if not should_scrape_source(source["name"]):
+            if should_scrape_source(source["name"]):
+                due_sources.append(source)
+            else:
                 logging.info(f"Skipping {source['name']} - recently scraped")
-                continue
 
-            try:
-                logging.info(f"Starting scrape for {source['name']}")
-                module = importlib.import_module(f"sources.{source['module']}")
-                # Get list of articles with retry logic
-                max_retries = 3
-                retry_delay = 5
-                articles = None
-                for attempt in range(max_retries):
-                    try:
-                        articles = module.scrape_all_articles()
-                        if isinstance(articles, list):
-                            break
-                        logging.error(f"Expected list of articles from {source['name']}, got {type(articles)}")
-                    except Exception as e:
-                        logging.error(f"Error scraping {source['name']} (attempt {attempt + 1}/{max_retries}): {str(e)}")
-                        if attempt < max_retries - 1:
-                            time.sleep(retry_delay * (attempt + 1))
-                        continue
-
-                if not articles:
-                    logging.warning(f"No articles found for {source['name']}")
-                    continue
-
-                articles_saved = 0
-                logging.info(f"Found {len(articles)} articles for {source['name']}")
-                if articles:
-                    logging.info(f"First article sample: {json.dumps(articles[0], default=str)}")
-
-                # Save articles with rate limiting
-                for article in articles:
-                    if should_exit:
-                        break
-                    try:
-                        if save_article(article):
-                            articles_saved += 1
-                            total_articles_saved += 1
-                            logging.info(f"Saved article: {article.get('title', '')[:50]}...")
-                        time.sleep(1)  # Rate limiting between saves
-                    except Exception as e:
-                        logging.error(f"Error saving article: {str(e)}")
-                        continue
-
-                # Update scrape time only if we successfully scraped and saved articles
-                if articles_saved > 0:
-                    update_scrape_time(source["name"])
-                    logging.info(f"Completed scraping {source['name']}. Saved {articles_saved} new articles.")
-                else:
-                    logging.warning(f"No new articles saved for {source['name']}")
-
-            except Exception as e:
-                logging.error(f"Error processing source {source['name']}: {str(e)}")
-                continue
+        if page_store_mode() != "off":
+            logging.info(f"Page store mode: {page_store_mode()}")
+        total_articles_saved = run_sources(due_sources)
 
     except Exception as e:
         logging.error(f"Error in main scraping loop: {str(e)}")
@@ -114,15 +353,24 @@ def main():
         logging.info("Scraping session completed")
         logging.info(f"Total articles saved in this session: {total_articles_saved}")
         logging.info(f"Final stats: {stats_after}")
+        logging.info(f"Database pool health: {get_pool_health()}")
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Scrape every configured news source that is due")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", action="store_true", help="archive every fetched page in the page store")
+    mode.add_argument("--replay", action="store_true", help="serve pages from the page store instead of the network")
+    parser.add_argument("--full", action="store_true", help="paginate every section to the end instead of stopping at known links")
+    return parser.parse_args()
 
 if __name__ == "__main__":
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler('scraper.log', encoding='utf-8'),
-            logging.StreamHandler(sys.stdout)
-        ]
-    )
+    args = parse_args()
+    if args.record:
+        set_page_store_mode("record")
+    elif args.replay:
+        set_page_store_mode("replay")
+    if args.full:
+        # Inherited by the worker processes, like the page store mode
+        os.environ["FULL_CRAWL"] = "1"
+    setup_logging()
     main()
-
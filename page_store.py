@@ -0,0 +1,210 @@
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import Counter
+from pathlib import Path
+from state import STATE_DIR, ProcessLocal
+
+try:
+    import zstandard
+except ImportError:  # Only needed when pages are recorded or replayed
+    zstandard = None
+
+# off: fetch from the network; record: fetch and archive every page; replay: serve archived pages only
+PAGE_STORE_MODES = ('off', 'record', 'replay')
+PAGE_STORE_DIR = Path(os.getenv("PAGE_STORE_DIR", STATE_DIR / "pages"))
+COMPRESSION_LEVEL = 10
+# Articles of replayed runs go here as JSON lines, never into MongoDB
+REPLAY_OUTPUT_DIR = Path(os.getenv("REPLAY_OUTPUT_DIR", STATE_DIR / "replay"))
+
+def page_store_mode():
+    mode = os.getenv("PAGE_STORE_MODE", "off")
+    return mode if mode in PAGE_STORE_MODES else "off"
+
+def set_page_store_mode(mode):
+    """Switch record/replay for this process and the worker processes it starts"""
+    if mode not in PAGE_STORE_MODES:
+        raise ValueError(f"Unknown page store mode {mode!r}, expected one of {PAGE_STORE_MODES}")
+    os.environ["PAGE_STORE_MODE"] = mode
+
+class PageStore:
+    """Content-addressed, zstd-compressed raw pages with an index by URL and fetch time"""
+    def __init__(self, root=PAGE_STORE_DIR):
+        if zstandard is None:
+            raise RuntimeError("The page store needs the zstandard package (pip install zstandard)")
+        self.root = Path(root)
+        (self.root / "blobs").mkdir(parents=True, exist_ok=True)
+        self.stats = Counter()
+        self._lock = threading.Lock()
+        self._compressor = zstandard.ZstdCompressor(level=COMPRESSION_LEVEL)
+        self._decompressor = zstandard.ZstdDecompressor()
+        # Worker processes and the fetcher thread all write here, so WAL and a generous busy timeout
+        self._db = sqlite3.connect(self.root / "index.sqlite", timeout=30, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("""CREATE TABLE IF NOT EXISTS pages (
+            url TEXT NOT NULL, fetched_at REAL NOT NULL, digest TEXT NOT NULL,
+            kind TEXT NOT NULL, source TEXT, size INTEGER NOT NULL)""")
+        self._db.execute("CREATE INDEX IF NOT EXISTS pages_url_time ON pages (url, fetched_at)")
+        self._db.commit()
+
+    def _blob_path(self, digest):
+        return self.root / "blobs" / digest[:2] / f"{digest}.zst"
+
+    def put(self, url, html, kind="static", source=None, fetched_at=None):
+        """Archive a page; identical content is stored once however often it is fetched"""
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._blob_path(digest)
+        if not path.exists():
+            path.parent.mkdir(exist_ok=True)
+            tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp_path.write_bytes(self._compressor.compress(data))
+            os.replace(tmp_path, path)
+            self.stats["blobs_written"] += 1
+        with self._lock:
+            self._db.execute("INSERT INTO pages VALUES (?, ?, ?, ?, ?, ?)",
+                             (url, fetched_at or time.time(), digest, kind, source, len(data)))
+            self._db.commit()
+        self.stats["recorded"] += 1
+        return digest
+
+    def read_blob(self, digest):
+        return self._decompressor.decompress(self._blob_path(digest).read_bytes()).decode("utf-8")
+
+    def get(self, url, prefer_kind=None, before=None):
+        """Latest archived HTML of url, preferring prefer_kind and optionally fetched before a timestamp; None if absent"""
+        entry = self.get_entry(url, prefer_kind, before)
+        return entry[0] if entry else None
+
+    def get_entry(self, url, prefer_kind=None, before=None):
+        """(html, fetched_at) of the archived copy get() would return, None if absent"""
+        query = "SELECT digest, fetched_at FROM pages WHERE url = ?"
+        params = [url]
+        if before:
+            query += " AND fetched_at <= ?"
+            params.append(before)
+        query += " ORDER BY kind = ? DESC, fetched_at DESC LIMIT 1"
+        params.append(prefer_kind)
+        with self._lock:
+            row = self._db.execute(query, params).fetchone()
+        if row is None:
+            self.stats["misses"] += 1
+            return None
+        self.stats["hits"] += 1
+        return self.read_blob(row[0]), row[1]
+
+    def latest_fetch_time(self, source=None):
+        """When the newest page (of source) was archived, None for an empty archive"""
+        query = "SELECT MAX(fetched_at) FROM pages"
+        params = []
+        if source:
+            query += " WHERE source = ?"
+            params.append(source)
+        with self._lock:
+            return self._db.execute(query, params).fetchone()[0]
+
+    def iter_pages(self, source=None, kind=None):
+        """Yield (url, fetched_at, html) for every archived fetch, oldest first"""
+        query = "SELECT url, fetched_at, digest FROM pages WHERE 1 = 1"
+        params = []
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        with self._lock:
+            rows = self._db.execute(query + " ORDER BY fetched_at", params).fetchall()
+        for url, fetched_at, digest in rows:
+            yield url, fetched_at, self.read_blob(digest)
+
+    def latest_pages(self, source=None, limit=None):
+        """Yield (url, source, html) for the latest archived copy of each URL, for benchmarks and parity checks"""
+        query = ("SELECT url, source, digest FROM pages AS p WHERE fetched_at = "
+                 "(SELECT MAX(fetched_at) FROM pages WHERE url = p.url)")
+        params = []
+        if source:
+            query += " AND source = ?"
+            params.append(source)
+        query += " ORDER BY url"
+        if limit:
+            query += " LIMIT ?"
+            params.append(limit)
+        with self._lock:
+            rows = self._db.execute(query, params).fetchall()
+        for url, page_source, digest in rows:
+            yield url, page_source, self.read_blob(digest)
+
+    def close(self):
+        with self._lock:
+            self._db.close()
+
+class ReplaySink:
+    """Articles of a replayed source, written to a JSON-lines file that each replay starts afresh"""
+    def __init__(self, name, root=REPLAY_OUTPUT_DIR):
+        Path(root).mkdir(parents=True, exist_ok=True)
+        self.path = Path(root) / f"{name}.jsonl"
+        self.path.write_text("", encoding="utf-8")
+        self._urls = set()
+
+    def save_articles(self, batch):
+        """Append a batch of articles; same result counts as database.save_articles()"""
+        result = {"inserted": 0, "duplicates": 0, "failed": 0}
+        with open(self.path, "a", encoding="utf-8") as f:
+            for article in batch:
+                if not article.get("url"):
+                    result["failed"] += 1
+                elif article["url"] in self._urls:
+                    result["duplicates"] += 1
+                else:
+                    self._urls.add(article["url"])
+                    f.write(json.dumps(article, default=str, sort_keys=True) + "\n")
+                    result["inserted"] += 1
+        return result
+
+_store = ProcessLocal(PageStore)
+# Archive time of every page replayed in this process, by URL; replay runs on the clock of the pages it reads
+_replayed_at = {}
+
+def get_page_store():
+    """This process's page store, or None when neither recording nor replaying"""
+    if page_store_mode() == "off":
+        return None
+    return _store.get()
+
+def replaying():
+    return page_store_mode() == "replay"
+
+def record_page(url, html, kind="static", source=None):
+    """Archive a fetched page when recording; never lets a storage error break the scrape"""
+    if page_store_mode() != "record" or html is None:
+        return
+    try:
+        get_page_store().put(url, html, kind=kind, source=source)
+    except Exception as e:
+        logging.error(f"[PageStore] Could not record {url}: {str(e)}")
+
+def replay_page(url, kind=None):
+    """Archived HTML for url when replaying, preferring the requested kind; None if it was never recorded"""
+    entry = get_page_store().get_entry(url, prefer_kind=kind)
+    if entry is None:
+        logging.warning(f"[PageStore] No archived copy of {url}")
+        return None
+    html, fetched_at = entry
+    _replayed_at[url] = fetched_at
+    return html
+
+def replayed_at(url):
+    """When the copy of url served by replay_page() was archived, None if none was served"""
+    return _replayed_at.get(url)
+
+def replay_clock(source=None):
+    """Time of the newest archived page of source, the "now" a replay of it runs at; None without one"""
+    fetched_at = get_page_store().latest_fetch_time(source)
+    if fetched_at is None:
+        logging.warning(f"[PageStore] Nothing archived for {source}, replaying at the current time")
+    return fetched_at
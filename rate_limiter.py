@@ -0,0 +1,150 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+from state import state_path, ProcessLocal
+
+try:
+    import fcntl
+except ImportError:  # Windows: buckets are then shared by the threads and event loops of one process only
+    fcntl = None
+
+# Defaults for domains without a "rate_limit" entry in config.json
+DEFAULT_RATE = 1.0  # Requests per second the bucket refills at
+DEFAULT_BURST = 2  # Requests that may go out back to back after a quiet spell
+DEFAULT_MAX_RATE = 4.0  # Ceiling the adaptive rate climbs back towards
+# Adaptive control: each success adds a step, each 429/503 halves the rate
+INCREASE_STEP = 0.05
+DECREASE_FACTOR = 0.5
+MIN_RATE = 0.05
+THROTTLE_STATUSES = {429, 503}
+# Bucket state older than this is from an earlier run and starts over
+STATE_TTL = 3600
+
+def domain_of(url):
+    host = urlparse(url).hostname or url
+    return host[4:] if host.startswith('www.') else host
+
+class RateLimiter:
+    """Per-domain token buckets kept in lock-protected state files, so threads, event loops and processes share them"""
+    def __init__(self):
+        self._settings = {}
+        self._locks = {}
+        self._guard = threading.Lock()
+
+    def configure(self, domain, rate=DEFAULT_RATE, burst=DEFAULT_BURST, max_rate=None):
+        self._settings[domain] = {'rate': float(rate), 'burst': float(burst),
+                                  'max_rate': float(max_rate or max(rate, DEFAULT_MAX_RATE))}
+
+    def is_configured(self, domain):
+        return domain in self._settings
+
+    def settings(self, domain):
+        return self._settings.get(domain) or {'rate': DEFAULT_RATE, 'burst': DEFAULT_BURST, 'max_rate': DEFAULT_MAX_RATE}
+
+    def _thread_lock(self, domain):
+        with self._guard:
+            return self._locks.setdefault(domain, threading.Lock())
+
+    def _update(self, domain, change):
+        """Apply change(bucket, settings, now) to the domain's bucket under a thread and file lock"""
+        settings = self.settings(domain)
+        path = state_path('rate_limits', f'{domain}.json')
+        with self._thread_lock(domain):
+            with open(path, 'a+', encoding='utf-8') as f:
+                if fcntl is not None:
+                    fcntl.flock(f, fcntl.LOCK_EX)
+                try:
+                    f.seek(0)
+                    try:
+                        bucket = json.loads(f.read() or '{}')
+                    except ValueError:
+                        bucket = {}
+                    now = time.time()
+                    if not bucket or now - bucket.get('updated', 0) > STATE_TTL:
+                        bucket = {'tokens': settings['burst'], 'rate': settings['rate'], 'updated': now, 'blocked_until': 0}
+                    bucket['rate'] = min(bucket['rate'], settings['max_rate'])
+                    # Refill at the current adaptive rate
+                    bucket['tokens'] = min(settings['burst'], bucket['tokens'] + (now - bucket['updated']) * bucket['rate'])
+                    bucket['updated'] = now
+                    result = change(bucket, settings, now)
+                    f.seek(0)
+                    f.truncate()
+                    f.write(json.dumps(bucket))
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(f, fcntl.LOCK_UN)
+        return result
+
+    def _reserve(self, domain):
+        """Take a token now, going into debt if necessary; returns the seconds to wait before sending"""
+        def take(bucket, settings, now):
+            bucket['tokens'] -= 1
+            wait = max(0.0, -bucket['tokens'] / bucket['rate'])
+            return max(wait, bucket['blocked_until'] - now)
+        return self._update(domain, take)
+
+    def acquire(self, url):
+        """Block the calling thread until a request to url's domain may be sent"""
+        wait = self._reserve(domain_of(url))
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url):
+        """Like acquire(), but yields to the event loop while waiting"""
+        # The state file is locked and rewritten in a worker thread, never on the event loop
+        wait = await asyncio.get_running_loop().run_in_executor(None, self._reserve, domain_of(url))
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def record(self, url, status, retry_after=None):
+        """Feed a response back: throttling halves the rate and pauses the domain, success creeps it up"""
+        domain = domain_of(url)
+
+        def adapt(bucket, settings, now):
+            if status in THROTTLE_STATUSES:
+                bucket['rate'] = max(MIN_RATE, bucket['rate'] * DECREASE_FACTOR)
+                pause = _retry_after_seconds(retry_after)
+                if pause is None:
+                    pause = 1 / bucket['rate']
+                bucket['blocked_until'] = max(bucket['blocked_until'], now + pause)
+                bucket['tokens'] = min(bucket['tokens'], 0)
+                return True
+            if status and status < 400:
+                bucket['rate'] = min(settings['max_rate'], bucket['rate'] + INCREASE_STEP)
+            return False
+        try:
+            if self._update(domain, adapt):
+                logging.warning(f"[RateLimiter] {domain} answered {status}, slowing down (retry after {retry_after or 'n/a'})")
+        except OSError as e:
+            logging.error(f"[RateLimiter] Could not record response for {domain}: {str(e)}")
+
+    async def record_async(self, url, status, retry_after=None):
+        """Like record(), with the state file updated in a worker thread"""
+        await asyncio.get_running_loop().run_in_executor(None, self.record, url, status, retry_after)
+
+    def snapshot(self, url):
+        return self._update(domain_of(url), lambda bucket, settings, now: dict(bucket))
+
+def _retry_after_seconds(value):
+    """Seconds from a Retry-After header, given as delta-seconds or an HTTP date"""
+    if value is None or value == '':
+        return None
+    value = str(value).strip()
+    if value.isdigit():
+        return int(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+_limiter = ProcessLocal(RateLimiter)
+
+def get_rate_limiter():
+    """Return this process's rate limiter; bucket state itself is shared through the state directory"""
+    return _limiter.get()
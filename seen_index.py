@@ -0,0 +1,98 @@
+import hashlib
+import heapq
+import json
+import logging
+import os
+import struct
+import time
+from array import array
+from bisect import bisect_left
+from bson import ObjectId
+from database import iter_article_urls
+from state import state_path, ProcessLocal
+
+INDEX_FILE = "seen_urls.idx"
+# Full rebuilds catch articles deleted from MongoDB; in between only new _ids are merged in
+REBUILD_AFTER = 7 * 24 * 3600
+
+def url_hash(url):
+    """64-bit hash of a URL; collisions are negligible at millions of URLs"""
+    return int.from_bytes(hashlib.blake2b(url.encode("utf-8"), digest_size=8).digest(), "little")
+
+class SeenUrlIndex:
+    """Sorted array of URL hashes for every stored article, searched by bisection"""
+    def __init__(self, hashes=None, last_id=None, built_at=None):
+        self.hashes = hashes if hashes is not None else array("Q")
+        self.last_id = last_id
+        self.built_at = built_at or time.time()
+
+    def __len__(self):
+        return len(self.hashes)
+
+    def _has(self, value):
+        position = bisect_left(self.hashes, value)
+        return position < len(self.hashes) and self.hashes[position] == value
+
+    def __contains__(self, url):
+        return self._has(url_hash(url))
+
+    def merge(self, urls):
+        """Add URLs, keeping the array sorted and free of duplicates"""
+        new = sorted(value for value in {url_hash(url) for url in urls} if not self._has(value))
+        if new:
+            self.hashes = array("Q", heapq.merge(self.hashes, new))
+
+    def save(self, path):
+        header = json.dumps({"last_id": str(self.last_id) if self.last_id else None,
+                             "built_at": self.built_at, "count": len(self.hashes)}).encode("utf-8")
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(struct.pack("<I", len(header)))
+            f.write(header)
+            self.hashes.tofile(f)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "rb") as f:
+            (header_size,) = struct.unpack("<I", f.read(4))
+            header = json.loads(f.read(header_size))
+            hashes = array("Q")
+            hashes.frombytes(f.read())
+        last_id = ObjectId(header["last_id"]) if header.get("last_id") else None
+        return cls(hashes, last_id, header.get("built_at"))
+
+def refresh_seen_index():
+    """Bring the on-disk index up to date with articles.url; called once per run before scraping"""
+    path = state_path(INDEX_FILE)
+    index = None
+    if os.path.exists(path):
+        try:
+            index = SeenUrlIndex.load(path)
+        except Exception as e:
+            logging.warning(f"[SeenIndex] Rebuilding unreadable index: {str(e)}")
+    if index is None or time.time() - index.built_at > REBUILD_AFTER:
+        index = SeenUrlIndex()
+    start = time.perf_counter()
+    urls = []
+    for _id, url in iter_article_urls(index.last_id):
+        urls.append(url)
+        index.last_id = _id
+    index.merge(urls)
+    index.save(path)
+    logging.info(f"[SeenIndex] {len(index)} known article URLs ({len(urls)} added) in {time.perf_counter() - start:.2f}s")
+    return index
+
+def _load_seen_index():
+    path = state_path(INDEX_FILE)
+    try:
+        return SeenUrlIndex.load(path) if os.path.exists(path) else refresh_seen_index()
+    except Exception as e:
+        logging.error(f"[SeenIndex] Could not load seen-URL index, nothing will be skipped: {str(e)}")
+        return SeenUrlIndex()
+
+_index = ProcessLocal(_load_seen_index)
+
+def get_seen_index():
+    """This process's copy of the seen-URL index, loaded from disk once (built from MongoDB if missing)"""
+    return _index.get()
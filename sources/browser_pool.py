@@ -0,0 +1,208 @@
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException, TimeoutException
+from selenium.webdriver.chrome.options import Options
+from state import SCRAPER_WORKERS, ProcessLocal
+
+DEFAULT_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+# Rough resident size of one headless Chrome with a news page open
+BROWSER_MEMORY_MB = int(os.getenv("BROWSER_MEMORY_MB", "400"))
+# Pages a browser serves before it is replaced, to shed leaked memory
+MAX_PAGES_PER_BROWSER = int(os.getenv("BROWSER_MAX_PAGES", "50"))
+# Seconds a scraper waits for a free browser before giving up
+LEASE_TIMEOUT = 300
+
+CHROME_ARGUMENTS = [
+    '--headless',
+    '--no-sandbox',
+    '--disable-dev-shm-usage',
+    '--disable-gpu',
+    '--disable-extensions',
+    '--disable-infobars',
+    '--disable-notifications',
+    '--disable-popup-blocking',
+    '--disable-blink-features=AutomationControlled',
+    '--disable-images',  # Disable images to speed up loading
+    '--blink-settings=imagesEnabled=false',  # Disable images in Blink
+    '--media-cache-size=1',  # Minimize media cache
+    '--disable-application-cache',  # Disable application cache
+    '--disable-offline-load-stale-cache',  # Disable offline cache
+    '--disable-background-networking',  # Disable background networking
+    '--disable-default-apps',  # Disable default apps
+    '--disable-sync',  # Disable sync
+    '--disable-translate',  # Disable translate
+    '--metrics-recording-only',  # Disable metrics recording
+    '--no-first-run',  # Disable first run
+    '--safebrowsing-disable-auto-update',  # Disable safebrowsing
+    '--password-store=basic',  # Disable password store
+    '--use-mock-keychain',  # Use mock keychain
+]
+
+def build_chrome_options(user_agent=DEFAULT_USER_AGENT):
+    """Chrome options shared by every pooled browser"""
+    options = Options()
+    for argument in CHROME_ARGUMENTS:
+        options.add_argument(argument)
+    options.add_argument(f'user-agent={user_agent}')
+    options.add_experimental_option('excludeSwitches', ['enable-automation'])
+    options.add_experimental_option('useAutomationExtension', False)
+    # Network events feed the per-page request and byte counters of the resource blocker
+    options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+    return options
+
+def _available_memory_mb():
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+def default_max_instances():
+    """Browsers this process may run: BROWSER_POOL_SIZE, or what free memory allows"""
+    configured = os.getenv("BROWSER_POOL_SIZE")
+    if configured:
+        return max(1, int(configured))
+    available = _available_memory_mb()
+    if available is None:
+        return 2
+    # Scraper worker processes each keep their own pool, so they split the memory
+    processes = max(1, SCRAPER_WORKERS)
+    return max(1, min(os.cpu_count() or 1, available // BROWSER_MEMORY_MB // processes))
+
+class PooledBrowser:
+    def __init__(self, driver):
+        self.driver = driver
+        self.pages = 0
+        self.broken = False
+        self.started_at = time.time()
+
+class BrowserPool:
+    """Warm headless Chrome instances handed out to scrapers one page at a time"""
+    def __init__(self, max_instances=None, max_pages=MAX_PAGES_PER_BROWSER, user_agent=DEFAULT_USER_AGENT):
+        self.max_instances = max_instances or default_max_instances()
+        self.max_pages = max_pages
+        self.user_agent = user_agent
+        self._idle = []
+        self._alive = 0
+        self._closed = False
+        self._condition = threading.Condition()
+        self.stats = {"launched": 0, "leases": 0, "recycled": 0, "crashed": 0, "unhealthy": 0}
+
+    def _launch(self):
+        driver = webdriver.Chrome(options=build_chrome_options(self.user_agent))
+        self.stats["launched"] += 1
+        logging.info(f"[BrowserPool] Launched browser {self.stats['launched']} ({self._alive}/{self.max_instances} alive)")
+        return PooledBrowser(driver)
+
+    def _is_healthy(self, browser):
+        try:
+            return browser.driver.execute_script("return 1") == 1 and bool(browser.driver.window_handles)
+        except Exception:
+            return False
+
+    def _discard(self, browser):
+        try:
+            browser.driver.quit()
+        except Exception:
+            pass
+        with self._condition:
+            self._alive -= 1
+            self._condition.notify()
+
+    def _acquire(self):
+        deadline = time.time() + LEASE_TIMEOUT
+        while True:
+            with self._condition:
+                if self._closed:
+                    raise RuntimeError("Browser pool is closed")
+                browser = self._idle.pop() if self._idle else None
+                if browser is None:
+                    if self._alive < self.max_instances:
+                        self._alive += 1
+                        break
+                    remaining = deadline - time.time()
+                    if remaining <= 0:
+                        raise TimeoutError(f"No browser became free within {LEASE_TIMEOUT}s")
+                    self._condition.wait(remaining)
+                    continue
+            if self._is_healthy(browser):
+                return browser
+            self.stats["unhealthy"] += 1
+            logging.warning("[BrowserPool] Discarding unresponsive browser")
+            self._discard(browser)
+        try:
+            return self._launch()
+        except Exception:
+            with self._condition:
+                self._alive -= 1
+                self._condition.notify()
+            raise
+
+    def _release(self, browser):
+        browser.pages += 1
+        if browser.broken:
+            self.stats["crashed"] += 1
+            self._discard(browser)
+            return
+        if browser.pages >= self.max_pages:
+            self.stats["recycled"] += 1
+            logging.info(f"[BrowserPool] Recycling browser after {browser.pages} pages")
+            self._discard(browser)
+            return
+        with self._condition:
+            if self._closed:
+                closed = True
+            else:
+                closed = False
+                self._idle.append(browser)
+                self._condition.notify()
+        if closed:
+            self._discard(browser)
+
+    @contextmanager
+    def lease(self):
+        """Borrow a warm driver for one page; it goes back to the pool afterwards"""
+        browser = self._acquire()
+        self.stats["leases"] += 1
+        try:
+            yield browser.driver
+        except TimeoutException:
+            # A slow page is not a broken browser; the next lease health-checks it anyway
+            raise
+        except WebDriverException:
+            # A driver error usually means the browser or its tab died; never reuse it
+            browser.broken = True
+            raise
+        finally:
+            self._release(browser)
+
+    def snapshot(self):
+        with self._condition:
+            return dict(self.stats, alive=self._alive, idle=len(self._idle), max_instances=self.max_instances)
+
+    def close(self):
+        with self._condition:
+            self._closed = True
+            idle, self._idle = self._idle, []
+        for browser in idle:
+            self._discard(browser)
+
+def _shut_down(pool):
+    logging.info(f"[BrowserPool] Shutting down: {pool.snapshot()}")
+    pool.close()
+
+_pool = ProcessLocal(BrowserPool, on_exit=_shut_down)
+
+def get_browser_pool():
+    """Return this process's browser pool, creating it on first use"""
+    return _pool.get()
+
+def close_browser_pool():
+    _pool.close()
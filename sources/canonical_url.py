@@ -0,0 +1,72 @@
+import re
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode, urljoin
+
+# Query parameters that only track where a click came from; the page is the same without them
+TRACKING_PARAMS = {'ref', 'ref_src', 'fbclid', 'gclid', 'dclid', 'msclkid', 'cmpid', 'ocid', 'mc_cid', 'mc_eid',
+                   'icid', 'src', 'share', 'amp', '__source', '__twitter_impression', 'igshid'}
+TRACKING_PREFIXES = ('utm_', 'at_', 'itm_', 'pk_')
+DEFAULT_PORTS = {'http': '80', 'https': '443'}
+REPEATED_SLASHES = re.compile(r'/{2,}')
+
+def _site(host):
+    return host[4:] if host.startswith('www.') else host
+
+class UrlCanonicalizer:
+    """Reduce the URL variants of one page to a single key, following a source's "canonical" rules
+
+    Rules (all optional): strip_params / keep_params (query parameter names), trailing_slash
+    ("strip", "keep" or "add"), scheme (default https) and rel_canonical (trust <link rel=canonical>,
+    default true). Hosts of the source's own site are rewritten to the base URL's host.
+    """
+    def __init__(self, rules, base_url):
+        self.host = urlsplit(base_url).netloc.lower()
+        self.scheme = rules.get('scheme', 'https')
+        self.strip_params = {name.lower() for name in rules.get('strip_params', [])} | TRACKING_PARAMS
+        self.keep_params = set(rules.get('keep_params', []))
+        self.trailing_slash = rules.get('trailing_slash', 'strip')
+        self.use_rel_canonical = rules.get('rel_canonical', True)
+
+    def _keep_param(self, name):
+        if name in self.keep_params:
+            return True
+        return name.lower() not in self.strip_params and not name.lower().startswith(TRACKING_PREFIXES)
+
+    def canonicalize(self, url):
+        """Canonical form of url: fragment and tracking parameters dropped, host, scheme and slashes normalized"""
+        try:
+            parts = urlsplit(url.strip())
+        except ValueError:
+            return url
+        if parts.scheme not in ('http', 'https') or not parts.netloc:
+            return url
+        host = parts.hostname or ''
+        if parts.port and str(parts.port) != DEFAULT_PORTS.get(parts.scheme):
+            host = f"{host}:{parts.port}"
+        own_site = _site(host) == _site(self.host)
+        if own_site:
+            host = self.host
+        scheme = self.scheme if own_site else parts.scheme
+        path = REPEATED_SLASHES.sub('/', parts.path) or '/'
+        if path != '/':
+            if self.trailing_slash == 'strip':
+                path = path.rstrip('/') or '/'
+            elif self.trailing_slash == 'add' and not path.endswith('/') and '.' not in path.rsplit('/', 1)[-1]:
+                path += '/'
+        params = sorted((name, value) for name, value in parse_qsl(parts.query, keep_blank_values=True)
+                        if self._keep_param(name))
+        return urlunsplit((scheme, host, path, urlencode(params), ''))
+
+    def resolve(self, href, url):
+        """Canonical form of a canonical-link href found on url, or None when off or pointing off-site"""
+        if not self.use_rel_canonical or not href:
+            return None
+        canonical = self.canonicalize(urljoin(url, href))
+        # A canonical link to another site (syndicated copies, broken templates) is not this page's key
+        if _site(urlsplit(canonical).netloc) != _site(urlsplit(self.canonicalize(url)).netloc):
+            return None
+        return canonical
+
+    def rel_canonical(self, soup, url):
+        """Canonical URL declared by the page's <link rel=canonical>, see resolve()"""
+        link = soup.select_one('link[rel~="canonical"][href]') if soup is not None else None
+        return self.resolve(link['href'], url) if link else None
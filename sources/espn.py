@@ -1,6 +1,7 @@
 import feedparser
 from datetime import datetime
 import logging
+from rate_limiter import get_rate_limiter, domain_of
 
 class EspnRssScraper:
     def __init__(self):
@@ -16,13 +17,16 @@ class EspnRssScraper:
             "olympics": "http://www.espn.com/espn/rss/olympics/news",
         }
 
-    def scrape_all_articles(self):
-        articles = []
+    def iter_articles(self):
+        article_count = 0
         for category, rss_url in self.rss_feeds.items():
             logging.info(f"[ESPN RSS] Đang lấy tin từ: {rss_url}")
+            get_rate_limiter().acquire(rss_url)
             feed = feedparser.parse(rss_url)
+            get_rate_limiter().record(rss_url, feed.get("status"), feed.get("headers", {}).get("retry-after"))
             for entry in feed.entries:
-                article = {
+                article_count += 1
+                yield {
                     "title": entry.title,
                     "content": entry.summary if hasattr(entry, "summary") else "",
                     "url": entry.link,
@@ -33,14 +37,19 @@ class EspnRssScraper:
                     ),
                     "source": self.source,
                 }
-                articles.append(article)
-        logging.info(f"[ESPN RSS] Tổng số bài lấy được: {len(articles)}")
-        return articles
+        logging.info(f"[ESPN RSS] Tổng số bài lấy được: {article_count}")
+
+    def scrape_all_articles(self):
+        return list(self.iter_articles())
 
     def scrape_article_content(self, url):
         # Không cần thiết với RSS, nhưng giữ lại cho tương thích hệ thống
         return None
 
-scraper = EspnRssScraper()
-scrape_all_articles = scraper.scrape_all_articles
-scrape_article_content = scraper.scrape_article_content 
\ No newline at end of file
+    def apply_config(self, source):
+        self.config = source
+        if source.get("rate_limit"):
+            get_rate_limiter().configure(domain_of(source["base_url"]), **source["rate_limit"])
+
+    def close(self):
+        pass
@@ -0,0 +1,95 @@
+import logging
+import zlib
+from collections import deque
+from datetime import timezone
+from email.utils import parsedate_to_datetime
+import xml.etree.ElementTree as ET
+import dateutil.parser
+
+CHUNK_SIZE = 64 * 1024
+# Child sitemaps followed from a sitemap index per feed; news indexes list the recent ones first
+MAX_SITEMAPS = 20
+ENTRY_TAGS = {'url', 'sitemap', 'item', 'entry'}
+DATE_TAGS = {'publication_date', 'lastmod', 'pubdate', 'published', 'updated', 'date'}
+
+def _local_name(tag):
+    return tag.rsplit('}', 1)[-1].lower()
+
+def _parse_date(text):
+    """Sitemap (W3C), RSS (RFC 822) or Atom (RFC 3339) date as an aware datetime, None if unparseable"""
+    try:
+        parsed = parsedate_to_datetime(text)
+    except (TypeError, ValueError):
+        try:
+            parsed = dateutil.parser.parse(text)
+        except (ValueError, OverflowError):
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def decompressed(chunks):
+    """Pass XML chunks through, gunzipping them when the feed is a .gz sitemap"""
+    decompressor = None
+    for chunk in chunks:
+        if decompressor is None:
+            decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if chunk[:2] == b'\x1f\x8b' else False
+        yield decompressor.decompress(chunk) if decompressor else chunk
+
+def iter_feed_entries(chunks):
+    """Stream (kind, url, lastmod) out of sitemap, sitemap index, RSS or Atom XML given as byte chunks
+
+    kind is 'sitemap' for the children of a sitemap index and 'page' otherwise. Entries are
+    cleared as soon as they are read, so memory stays flat however large the feed is.
+    """
+    parser = ET.XMLPullParser(events=('start', 'end'))
+    entry = None
+    for chunk in chunks:
+        parser.feed(chunk)
+        for event, element in parser.read_events():
+            name = _local_name(element.tag)
+            if event == 'start':
+                if name in ENTRY_TAGS and entry is None:
+                    entry = {'kind': 'sitemap' if name == 'sitemap' else 'page', 'url': None, 'lastmod': None, 'tag': name}
+                continue
+            if entry is None:
+                continue
+            text = (element.text or '').strip()
+            if name == entry['tag']:
+                if entry['url']:
+                    yield entry['kind'], entry['url'], entry['lastmod']
+                entry = None
+                element.clear()
+            elif name == 'loc' or (name == 'link' and text):
+                # The first <loc> of a <url> is the page; image and video locations come after it
+                entry['url'] = entry['url'] or text
+            elif name == 'link' and element.get('href') and element.get('rel', 'alternate') == 'alternate':
+                entry['url'] = entry['url'] or element.get('href')
+            elif name in DATE_TAGS and text and entry['lastmod'] is None:
+                entry['lastmod'] = _parse_date(text)
+    parser.close()
+
+def iter_feed_links(feed_url, fetch, since=None, max_sitemaps=MAX_SITEMAPS):
+    """Yield (url, lastmod) for every page a feed lists, following sitemap indexes breadth first
+
+    fetch(url) returns the feed's XML as byte chunks, or None when it is unchanged or unavailable.
+    Entries (and child sitemaps) whose date is before since are skipped; undated ones are kept.
+    """
+    pending = deque([feed_url])
+    visited = set()
+    while pending and len(visited) <= max_sitemaps:
+        url = pending.popleft()
+        if url in visited:
+            continue
+        visited.add(url)
+        chunks = fetch(url)
+        if chunks is None:
+            continue
+        try:
+            for kind, location, lastmod in iter_feed_entries(chunks):
+                if since and lastmod and lastmod < since:
+                    continue
+                if kind == 'sitemap':
+                    pending.append(location)
+                else:
+                    yield location, lastmod
+        except ET.ParseError as e:
+            logging.warning(f"[FeedDiscovery] Could not parse {url}: {str(e)}")
@@ -0,0 +1,61 @@
+import re
+from urllib.parse import urlparse
+from state import state_path, load_json, save_json
+
+# Pages fetched through the browser before a URL class gets another static probe
+PROBE_EVERY = 25
+
+_HAS_DIGIT = re.compile(r'\d')
+
+def _is_variable(segment):
+    """Article slugs and ids vary per page; section names do not"""
+    if '-' in segment:
+        return len(segment) >= 15 or bool(_HAS_DIGIT.search(segment))
+    return len(segment) >= 8 and bool(_HAS_DIGIT.search(segment)) and not segment.isdigit()
+
+def url_class(url):
+    """Collapse a URL into a pattern shared by pages of the same kind, e.g. /f1/news/*/#"""
+    parsed = urlparse(url)
+    segments = []
+    for segment in parsed.path.split('/'):
+        if segment.isdigit():
+            segments.append('#')
+        elif _is_variable(segment):
+            segments.append('*')
+        else:
+            segments.append(segment)
+    pattern = parsed.netloc + '/'.join(segments)
+    if parsed.query:
+        keys = sorted(part.split('=')[0] for part in parsed.query.split('&'))
+        pattern += '?' + '&'.join(keys)
+    return pattern
+
+class FetchStrategyMemory:
+    """Remembers per URL class whether plain HTTP was enough or the page needed a browser"""
+    def __init__(self, name):
+        self.path = state_path('fetch_strategy', f'{name}.json')
+        self.classes = load_json(self.path, {})
+
+    def preferred(self, url):
+        """'browser' if static fetches failed for this kind of page, otherwise 'static'"""
+        entry = self.classes.get(url_class(url))
+        if entry and entry['mode'] == 'browser' and entry['since_probe'] < PROBE_EVERY:
+            return 'browser'
+        return 'static'
+
+    def record(self, url, path, ready):
+        entry = self.classes.setdefault(url_class(url), {'mode': 'static', 'static_ok': 0, 'static_failed': 0,
+                                                         'browser': 0, 'since_probe': 0})
+        if path == 'browser':
+            entry['browser'] += 1
+            entry['since_probe'] += 1
+        elif ready:
+            entry['mode'] = 'static'
+            entry['static_ok'] += 1
+        else:
+            entry['mode'] = 'browser'
+            entry['static_failed'] += 1
+            entry['since_probe'] = 0
+
+    def save(self):
+        save_json(self.path, self.classes)
@@ -0,0 +1,296 @@
+import logging
+from functools import lru_cache
+import lxml.html
+from lxml.cssselect import CSSSelector
+
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional; lxml's C parser with compiled CSS selectors is the fast path without it
+    LexborHTMLParser = None
+
+# Attributes BeautifulSoup returns as lists of tokens; the fast engines do the same so extractors see one shape
+MULTI_VALUED = {'class', 'rel', 'rev', 'accept-charset', 'headers', 'accesskey', 'dropzone'}
+# Elements whose text BeautifulSoup leaves out of get_text() unless asked for the element itself
+HIDDEN_TEXT = {'script', 'style', 'template'}
+HIDDEN_SELECTOR = ', '.join(sorted(HIDDEN_TEXT))
+EMPTY_DOCUMENT = '<html></html>'
+
+def _attribute(name, value):
+    if value is not None and name in MULTI_VALUED:
+        return value.split()
+    return value
+
+def class_string(node):
+    """The class attribute of a node from any engine, as one space-separated string"""
+    value = node.get('class') or ''
+    return value if isinstance(value, str) else ' '.join(value)
+
+def class_selector(tags, *names):
+    """CSS selector list for elements of the given tag(s) whose class contains any of names"""
+    tags = [tags] if isinstance(tags, str) else tags
+    return ', '.join(f'{tag}[class*="{name}"]' for tag in tags for name in names)
+
+class ClassMatcher:
+    """Class test for elements of some tags, compiled once from declared class names
+
+    With match "exact" an element matches when one of its classes is a declared name: a
+    frozenset lookup, and a single CSS selector the engine runs natively. With "contains" (how
+    the regex alternations it replaces behaved) a class matches when a declared name occurs in
+    it; the verdict for each distinct class is worked out once and remembered, so every later
+    element costs one set lookup per class it has.
+    """
+    def __init__(self, names, tags=('div', 'article'), match='contains'):
+        self.names = frozenset(names)
+        self.tags = tuple(tags)
+        self.exact = match == 'exact'
+        self._matched = set()
+        self._unmatched = set()
+        if self.exact:
+            self.selector = ', '.join(f'{tag}.{name}' for tag in self.tags for name in sorted(self.names))
+        else:
+            self.selector = ', '.join(f'{tag}[class]' for tag in self.tags)
+
+    def _class_matches(self, token):
+        if token in self._matched:
+            return True
+        if token in self._unmatched:
+            return False
+        matched = any(name in token for name in self.names)
+        (self._matched if matched else self._unmatched).add(token)
+        return matched
+
+    def _class_filter(self, token):
+        # BeautifulSoup's class_ callback: each class in turn, then the whole attribute; None without one
+        if token is None:
+            return False
+        return token in self.names if self.exact else self._class_matches(token)
+
+    def matches(self, classes):
+        """Whether an element with these classes (a list, or a space-separated string) matches"""
+        if isinstance(classes, str):
+            classes = classes.split()
+        if self.exact:
+            return not self.names.isdisjoint(classes)
+        return any(self._class_matches(token) for token in classes)
+
+    def select(self, document):
+        """Matching elements of a document from any engine, in document order"""
+        if hasattr(document, 'find_all'):
+            # BeautifulSoup walks its tree faster with the test as a class_ filter than through soupsieve
+            return document.find_all(self.tags, class_=self._class_filter)
+        candidates = document.select(self.selector)
+        if self.exact:
+            return candidates
+        return [element for element in candidates if self.matches(element.get('class') or ())]
+
+@lru_cache(maxsize=1024)
+def _compiled(css):
+    # Each selector is translated to XPath once per process, not once per call
+    return CSSSelector(css, translator='html')
+
+class LxmlNode:
+    """lxml.html element behind the part of BeautifulSoup's Tag API the extractors use
+
+    select/select_one take CSS, get/[] read attributes, get_text(separator, strip) follows
+    BeautifulSoup (script and style text only for those elements themselves), and parent,
+    find_parent, decompose and str() work as on a Tag.
+    """
+    def __init__(self, element):
+        self._element = element
+
+    @property
+    def name(self):
+        return self._element.tag
+
+    @property
+    def parent(self):
+        parent = self._element.getparent()
+        return LxmlNode(parent) if parent is not None else None
+
+    def select(self, css):
+        return [LxmlNode(element) for element in _compiled(css)(self._element) if element is not self._element]
+
+    def select_one(self, css):
+        for element in _compiled(css)(self._element):
+            if element is not self._element:
+                return LxmlNode(element)
+        return None
+
+    def find_parent(self, name):
+        for element in self._element.iterancestors(name):
+            return LxmlNode(element)
+        return None
+
+    def get(self, name, default=None):
+        value = _attribute(name, self._element.get(name))
+        return default if value is None else value
+
+    def has_attr(self, name):
+        return name in self._element.attrib
+
+    def __getitem__(self, name):
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def _strings(self, element, top):
+        if isinstance(element.tag, str) and (top or element.tag not in HIDDEN_TEXT):
+            if element.text:
+                yield element.text
+            for child in element:
+                yield from self._strings(child, False)
+        if not top and element.tail:
+            yield element.tail
+
+    def get_text(self, separator='', strip=False):
+        strings = self._strings(self._element, True)
+        if strip:
+            strings = (text.strip() for text in strings)
+            strings = (text for text in strings if text)
+        return separator.join(strings)
+
+    @property
+    def text(self):
+        return self.get_text()
+
+    def decompose(self):
+        self._element.drop_tree()
+
+    def __str__(self):
+        return lxml.html.tostring(self._element, encoding='unicode', with_tail=False)
+
+    def __bool__(self):
+        return True
+
+class LxmlDocument(LxmlNode):
+    """Whole page parsed by lxml; unlike an element, it can match its own <html> root"""
+    def select(self, css):
+        return [LxmlNode(element) for element in _compiled(css)(self._element)]
+
+    def select_one(self, css):
+        for element in _compiled(css)(self._element):
+            return LxmlNode(element)
+        return None
+
+class LexborNode:
+    """selectolax (lexbor) node behind the same BeautifulSoup subset as LxmlNode"""
+    def __init__(self, node):
+        self._node = node
+
+    @property
+    def name(self):
+        return self._node.tag
+
+    @property
+    def parent(self):
+        parent = self._node.parent
+        return LexborNode(parent) if parent is not None and not parent.tag.startswith('-') else None
+
+    def select(self, css):
+        return [LexborNode(node) for node in self._node.css(css) if node.mem_id != self._node.mem_id]
+
+    def select_one(self, css):
+        matches = self.select(css)
+        return matches[0] if matches else None
+
+    def find_parent(self, name):
+        parent = self.parent
+        while parent is not None and parent.name != name:
+            parent = parent.parent
+        return parent
+
+    def get(self, name, default=None):
+        value = _attribute(name, self._node.attributes.get(name))
+        return default if value is None else value
+
+    def has_attr(self, name):
+        return name in self._node.attributes
+
+    def __getitem__(self, name):
+        value = self.get(name)
+        if value is None:
+            raise KeyError(name)
+        return value
+
+    def _strings(self, node, top):
+        if node.tag == '-text':
+            yield node.text_content or ''
+            return
+        if node.tag.startswith('-') or (not top and node.tag in HIDDEN_TEXT):
+            return
+        child = node.child
+        while child is not None:
+            yield from self._strings(child, False)
+            child = child.next
+
+    def get_text(self, separator='', strip=False):
+        if self._node.tag in HIDDEN_TEXT or self._node.css_first(HIDDEN_SELECTOR) is None:
+            if not strip:
+                return self._node.text(deep=True, separator=separator)
+            # selectolax keeps the strings that strip to nothing, so split on NUL (dropped by the HTML parser) and filter like BeautifulSoup
+            strings = (text.strip() for text in self._node.text(deep=True, separator='\0').split('\0'))
+            return separator.join(text for text in strings if text)
+        # Walked in Python only when scripts or styles are inside, whose text BeautifulSoup leaves out
+        strings = self._strings(self._node, True)
+        if strip:
+            strings = (text.strip() for text in strings)
+            strings = (text for text in strings if text)
+        return separator.join(strings)
+
+    @property
+    def text(self):
+        return self.get_text()
+
+    def decompose(self):
+        self._node.decompose()
+
+    def __str__(self):
+        return self._node.html or ''
+
+    def __bool__(self):
+        return True
+
+class LexborDocument(LexborNode):
+    def __init__(self, parser):
+        super().__init__(parser.root)
+        self._parser = parser
+
+    def select(self, css):
+        return [LexborNode(node) for node in self._parser.css(css)]
+
+    def select_one(self, css):
+        node = self._parser.css_first(css)
+        return LexborNode(node) if node is not None else None
+
+    def __str__(self):
+        return self._parser.html or ''
+
+def _parse_lxml(html):
+    if isinstance(html, str) and html.lstrip().startswith('<?xml'):
+        # lxml refuses str input that declares its own encoding
+        html = html.encode('utf-8')
+    try:
+        return LxmlDocument(lxml.html.document_fromstring(html or EMPTY_DOCUMENT))
+    except lxml.etree.ParserError:
+        return LxmlDocument(lxml.html.document_fromstring(EMPTY_DOCUMENT))
+
+def _parse_lexbor(html):
+    return LexborDocument(LexborHTMLParser(html or EMPTY_DOCUMENT))
+
+ENGINES = {'lxml': _parse_lxml}
+if LexborHTMLParser is not None:
+    ENGINES['lexbor'] = _parse_lexbor
+# Fastest engine installed; 'soup' (BeautifulSoup) is the compatibility path and is handled by the scraper
+DEFAULT_ENGINE = 'lexbor' if 'lexbor' in ENGINES else 'lxml'
+
+def resolve_engine(name):
+    """Engine to use for a configured name, falling back to the default when it is not installed"""
+    if name in ENGINES or name == 'soup':
+        return name
+    logging.warning(f"[HtmlEngine] HTML engine {name!r} is not available, using {DEFAULT_ENGINE}")
+    return DEFAULT_ENGINE
+
+def parse_document(html, engine=DEFAULT_ENGINE):
+    """Parse html with a fast engine into a document with the BeautifulSoup-style select API"""
+    return ENGINES[engine](html)
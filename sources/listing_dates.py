@@ -0,0 +1,67 @@
+import re
+from datetime import datetime, timedelta, timezone
+import dateutil.parser
+from sources.html_engine import class_string
+
+# Attributes listing cards commonly carry their publication time in
+DATE_ATTRIBUTES = ('datetime', 'data-timestamp', 'data-published', 'data-publish-date', 'data-date', 'data-time')
+DATE_CLASSES = re.compile(r'time|date|timestamp|published', re.I)
+DATED_SELECTOR = ', '.join(f'[{attribute}]' for attribute in DATE_ATTRIBUTES)
+CLASSED_SELECTOR = 'time[class], span[class], div[class], p[class]'
+RELATIVE_TIME = re.compile(r'(\d+)\s*(seconds?|secs?|s|minutes?|mins?|m|hours?|hrs?|h|days?|d|weeks?|w)\s+ago', re.I)
+UNIT_SECONDS = {'s': 1, 'm': 60, 'h': 3600, 'd': 86400, 'w': 604800}
+# All-digit values: compact dates by length, and epoch seconds (10 digits) or milliseconds (13 digits)
+DIGIT_FORMATS = {8: '%Y%m%d', 12: '%Y%m%d%H%M', 14: '%Y%m%d%H%M%S'}
+EPOCH_DIGITS = {10: 1, 13: 1000}
+
+def _parse_value(value):
+    """Absolute datetime from an attribute value: epoch seconds or milliseconds, a compact or an ISO-like date"""
+    value = value.strip()
+    if not value:
+        return None
+    if value.isdigit():
+        if len(value) in DIGIT_FORMATS:
+            try:
+                return datetime.strptime(value, DIGIT_FORMATS[len(value)]).replace(tzinfo=timezone.utc)
+            except ValueError:
+                return None
+        if len(value) not in EPOCH_DIGITS:
+            return None
+        return datetime.fromtimestamp(int(value) / EPOCH_DIGITS[len(value)], timezone.utc)
+    try:
+        parsed = dateutil.parser.parse(value)
+    except (ValueError, OverflowError):
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+def _parse_relative(text, now):
+    match = RELATIVE_TIME.search(text)
+    if not match:
+        return None
+    unit = match.group(2).lower()
+    # "min"/"mins"/"minutes" and "m" are minutes; "month" never matches the pattern
+    seconds = UNIT_SECONDS['m' if unit.startswith('min') else unit[0]]
+    return now - timedelta(seconds=int(match.group(1)) * seconds)
+
+def card_timestamp(card, now=None):
+    """Publication time shown on a listing card, or None when the card has none
+
+    Looks at date attributes on the card and its descendants first, then at "N hours ago"
+    style text in its time/date elements. Naive times are taken as UTC.
+    """
+    if card is None:
+        return None
+    now = now or datetime.now(timezone.utc)
+    dated = card.select(DATED_SELECTOR)
+    for element in [card] + dated:
+        for attribute in DATE_ATTRIBUTES:
+            if element.has_attr(attribute):
+                parsed = _parse_value(str(element[attribute]))
+                if parsed:
+                    return parsed
+    classed = [element for element in card.select(CLASSED_SELECTOR) if DATE_CLASSES.search(class_string(element))]
+    for element in classed + card.select('time'):
+        parsed = _parse_relative(element.get_text(" ", strip=True), now)
+        if parsed:
+            return parsed
+    return None
@@ -0,0 +1,79 @@
+import re
+from bs4 import BeautifulSoup, SoupStrainer
+
+# lxml builds the tree in C; html.parser is pure Python and several times slower on large pages
+DEFAULT_PARSER = 'lxml'
+# Always kept on article pages: metadata, headline, dates and the article element itself
+ARTICLE_TAGS = {'title', 'meta', 'link', 'h1', 'time', 'article'}
+# Containers whose class looks like part of the article (body, headline, byline, dates)
+ARTICLE_CLASSES = re.compile(r'article|story|headline|title|date|time|published|content|body', re.I)
+LISTING_TAGS = {'a', 'time'}
+SELECTOR_CLASSES = re.compile(r'\.([\w-]+)')
+SELECTOR_TAG = re.compile(r'^\s*([a-zA-Z][\w-]*)')
+
+def _class_string(attrs):
+    value = (attrs or {}).get('class') or ''
+    return value if isinstance(value, str) else ' '.join(value)
+
+def selector_tokens(css):
+    """Tag names and class names a simple CSS selector list refers to, so a strainer keeps what it matches"""
+    tags, classes = set(), set()
+    for part in (css or '').split(','):
+        tag = SELECTOR_TAG.match(part)
+        if tag:
+            tags.add(tag.group(1).lower())
+        classes.update(SELECTOR_CLASSES.findall(part))
+    return tags, classes
+
+class TagStrainer(SoupStrainer):
+    """Keep only the elements (with their subtrees) for which keep(name, attrs) is true
+
+    Works with the parse_only hooks of both BeautifulSoup 4.12 (search_tag) and 4.13+
+    (allow_tag_creation); text outside kept elements is dropped.
+    """
+    def __init__(self, keep):
+        super().__init__()
+        self.keep = keep
+
+    def search_tag(self, markup_name=None, markup_attrs={}):
+        return self.keep(markup_name, markup_attrs)
+
+    def allow_tag_creation(self, nsprefix, name, attrs):
+        return self.keep(name, attrs)
+
+    def allow_string_creation(self, string):
+        return False
+
+def listing_strainer(card_matcher=None, ready_selector=None):
+    """Links, timestamps and the cards around them; <article> stands in for cards when the source declares none"""
+    ready_tags, ready_classes = selector_tokens(ready_selector)
+    tags = LISTING_TAGS | ready_tags | ({'article'} if card_matcher is None else set())
+
+    def keep(name, attrs):
+        if name in tags:
+            return True
+        classes = _class_string(attrs)
+        if card_matcher is not None and card_matcher.matches(classes):
+            return True
+        return bool(ready_classes) and not ready_classes.isdisjoint(classes.split())
+    return TagStrainer(keep)
+
+def article_strainer(class_pattern=ARTICLE_CLASSES, ready_selector=None):
+    """Head metadata, inline scripts (JSON-LD, __NEXT_DATA__, state globals) and article-like containers"""
+    ready_tags, ready_classes = selector_tokens(ready_selector)
+    tags = ARTICLE_TAGS | ready_tags
+
+    def keep(name, attrs):
+        if name in tags:
+            return True
+        if name == 'script':
+            # Inline scripts hold the structured data; external ones are empty
+            return not (attrs or {}).get('src')
+        classes = _class_string(attrs)
+        if class_pattern.search(classes):
+            return True
+        return bool(ready_classes) and not ready_classes.isdisjoint(classes.split())
+    return TagStrainer(keep)
+
+def make_soup(html, parser=DEFAULT_PARSER, strainer=None):
+    return BeautifulSoup(html, parser, parse_only=strainer)
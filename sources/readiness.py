@@ -0,0 +1,96 @@
+import time
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support.ui import WebDriverWait
+from selenium.webdriver.support import expected_conditions as EC
+
+DEFAULT_RENDER_SETTINGS = {
+    "ready_timeout": 15,  # Seconds to wait for the ready selector to appear
+    "quiet_ms": 500,  # DOM must stay unchanged this long to count as settled
+    "max_settle_ms": 5000,  # Upper bound on waiting for the DOM to settle
+    "max_scrolls": 5,  # Lazy-loading scrolls on listing pages
+}
+
+# Resolves once no DOM mutation has happened for quietMs, or after maxMs in any case
+DOM_QUIET_SCRIPT = """
+const quietMs = arguments[0], maxMs = arguments[1], done = arguments[arguments.length - 1];
+const start = performance.now();
+let quietTimer = null, capTimer = null;
+const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(finish, quietMs);
+});
+function finish() {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(capTimer);
+    done(performance.now() - start);
+}
+observer.observe(document, {childList: true, subtree: true, characterData: true});
+quietTimer = setTimeout(finish, quietMs);
+capTimer = setTimeout(finish, maxMs);
+"""
+
+COUNT_SCRIPT = "return document.querySelectorAll(arguments[0]).length;"
+
+def selectors_to_css(selectors):
+    """Combine (By, value) wait selectors into one CSS selector, leaving out the body fallback"""
+    parts = []
+    for by, value in selectors:
+        if by == By.CLASS_NAME:
+            parts.append(f".{value}")
+        elif by == By.TAG_NAME and value != "body":
+            parts.append(value)
+        elif by == By.CSS_SELECTOR:
+            parts.append(value)
+    return ", ".join(parts)
+
+def wait_for_selector(driver, css_selector, timeout):
+    """Wait until any element matches css_selector; False if it never appears"""
+    if not css_selector:
+        return False
+    try:
+        WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.CSS_SELECTOR, css_selector)))
+        return True
+    except Exception:
+        return False
+
+def wait_for_dom_quiet(driver, quiet_ms, max_settle_ms):
+    """Block until the DOM stops changing; returns the milliseconds it took"""
+    try:
+        return driver.execute_async_script(DOM_QUIET_SCRIPT, quiet_ms, max_settle_ms)
+    except Exception:
+        return None
+
+def count_matches(driver, css_selector):
+    try:
+        return driver.execute_script(COUNT_SCRIPT, css_selector)
+    except Exception:
+        return 0
+
+def scroll_until_stable(driver, css_selector, settings):
+    """Scroll to the bottom until no new article nodes show up; returns the scrolls made"""
+    previous = count_matches(driver, css_selector)
+    scrolls = 0
+    while scrolls < settings["max_scrolls"]:
+        driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
+        scrolls += 1
+        wait_for_dom_quiet(driver, settings["quiet_ms"], settings["max_settle_ms"])
+        current = count_matches(driver, css_selector)
+        if current <= previous:
+            break
+        previous = current
+    return scrolls
+
+def wait_until_ready(driver, css_selector, settings, scroll=False):
+    """Wait for content, DOM quiescence and (optionally) lazy loading; returns timings"""
+    start = time.perf_counter()
+    found = wait_for_selector(driver, css_selector, settings["ready_timeout"])
+    selector_s = time.perf_counter() - start
+    wait_for_dom_quiet(driver, settings["quiet_ms"], settings["max_settle_ms"])
+    scrolls = scroll_until_stable(driver, settings.get("article_selector") or css_selector, settings) if scroll and found else 0
+    return {
+        "selector_found": found,
+        "selector_s": round(selector_s, 3),
+        "ready_s": round(time.perf_counter() - start, 3),
+        "scrolls": scrolls
+    }
@@ -0,0 +1,39 @@
+import json
+import importlib
+import logging
+from contextlib import contextmanager
+from pathlib import Path
+
+CONFIG_PATH = Path(__file__).parent.parent / "config.json"
+
+def load_source_configs(config_path=CONFIG_PATH):
+    """Read the list of configured sources without importing any scraper module"""
+    with open(config_path) as f:
+        return json.load(f)
+
+def source_id(source):
+    """Short stable name of a source, used for its state files and threads"""
+    return source.get("id") or source["module"]
+
+def get_scraper_class(source):
+    """Import the source module and return the scraper class named in config.json
+
+    Sources without a module of their own are scraped from their profile by ProfileScraper.
+    """
+    if "module" not in source:
+        return importlib.import_module("sources.base_scraper").ProfileScraper
+    module = importlib.import_module(f"sources.{source['module']}")
+    return getattr(module, source["scraper_class"])
+
+@contextmanager
+def open_scraper(source):
+    """Build a source's scraper when a scrape starts and tear it down afterwards"""
+    scraper = get_scraper_class(source)()
+    scraper.apply_config(source)
+    try:
+        yield scraper
+    finally:
+        try:
+            scraper.close()
+        except Exception as e:
+            logging.error(f"Error closing scraper for {source['name']}: {str(e)}")
@@ -0,0 +1,94 @@
+import json
+import logging
+from urllib.parse import urlparse
+
+# Resource types and ad/tracking hosts no article page needs to render its text
+DEFAULT_BLOCKED_PATTERNS = [
+    '*.png', '*.jpg', '*.jpeg', '*.gif', '*.webp', '*.avif', '*.svg', '*.ico',
+    '*.woff', '*.woff2', '*.ttf', '*.otf', '*.eot',
+    '*.mp4', '*.webm', '*.m3u8', '*.ts', '*.mp3',
+    '*doubleclick.net*', '*googlesyndication.com*', '*googleadservices.com*',
+    '*google-analytics.com*', '*googletagmanager.com*', '*googletagservices.com*',
+    '*amazon-adsystem.com*', '*adnxs.com*', '*criteo.*', '*taboola.com*', '*outbrain.com*',
+    '*scorecardresearch.com*', '*chartbeat.*', '*moatads.com*', '*quantserve.com*',
+    '*facebook.net*', '*connect.facebook.*', '*twitter.com/widgets*', '*platform.twitter.com*',
+    '*optimizely.com*', '*permutive.*', '*hotjar.com*', '*newrelic.com*', '*nr-data.net*',
+    '*onetrust.com*', '*cookielaw.org*', '*jwplayer*', '*jwpcdn.com*', '*brightcove*',
+]
+
+# Resource types a page renders its text without; a third-party host is only learned when all it served was these
+PASSIVE_TYPES = {'Image', 'Media', 'Font', 'Ping', 'CSPViolationReport'}
+
+def _host_matches(host, allowed):
+    return any(host == name or host.endswith('.' + name) for name in allowed)
+
+class ResourceBlocker:
+    """Block non-essential requests in a pooled browser via CDP and count what each page loaded
+
+    Blocked requests are never downloaded, so their size is unknown: the counters give requests
+    blocked and the bytes that did load, which is the figure blocking brings down.
+    """
+    def __init__(self, settings, base_url):
+        self.enabled = settings.get('enabled', True)
+        base_host = urlparse(base_url).hostname or ''
+        if base_host.startswith('www.'):
+            base_host = base_host[4:]
+        self.allow_hosts = set(settings.get('allow_hosts', [])) | {base_host}
+        allowed_patterns = set(settings.get('allow_patterns', []))
+        self.patterns = [p for p in DEFAULT_BLOCKED_PATTERNS + settings.get('block', []) if p not in allowed_patterns]
+        # With "block_third_party": true, third-party hosts that served only images, media and fonts
+        # on earlier pages are blocked from the next page on; scripts and data from CDNs are never learned
+        self.block_third_party = settings.get('block_third_party', False)
+        self.learned_hosts = set()
+        self._host_types = {}
+
+    def blocked_urls(self):
+        if not self.enabled:
+            return []
+        return self.patterns + [f'*//{host}/*' for host in sorted(self.learned_hosts)]
+
+    def apply(self, driver):
+        """Install this source's block list on a leased browser (replacing the previous source's)"""
+        driver.execute_cdp_cmd('Network.enable', {})
+        driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': self.blocked_urls()})
+        # Drop events left over from whichever page this browser rendered before
+        self._read_events(driver)
+
+    def _read_events(self, driver):
+        try:
+            return driver.get_log('performance')
+        except Exception:
+            return []
+
+    def collect(self, driver):
+        """Tally requests blocked and bytes loaded for the page just rendered and learn new third-party hosts"""
+        stats = {'requests_loaded': 0, 'requests_blocked': 0, 'bytes_loaded': 0, 'third_party_loaded': 0}
+        hosts = {}
+        third_party = set()
+        for entry in self._read_events(driver):
+            try:
+                message = json.loads(entry['message'])['message']
+            except (KeyError, ValueError):
+                continue
+            method = message.get('method')
+            params = message.get('params', {})
+            if method == 'Network.requestWillBeSent':
+                host = urlparse(params.get('request', {}).get('url', '')).hostname or ''
+                hosts[params.get('requestId')] = host
+                self._host_types.setdefault(host, set()).add(params.get('type'))
+            elif method == 'Network.loadingFailed' and params.get('blockedReason'):
+                stats['requests_blocked'] += 1
+            elif method == 'Network.loadingFinished':
+                stats['requests_loaded'] += 1
+                stats['bytes_loaded'] += int(params.get('encodedDataLength', 0))
+                host = hosts.get(params.get('requestId'), '')
+                if host and not _host_matches(host, self.allow_hosts):
+                    stats['third_party_loaded'] += 1
+                    third_party.add(host)
+        if self.block_third_party:
+            # Decided after the whole page, once every type of request a host served is known
+            for host in third_party - self.learned_hosts:
+                if self._host_types[host] <= PASSIVE_TYPES:
+                    self.learned_hosts.add(host)
+                    logging.debug(f"[ResourceBlocker] Blocking third-party host {host} from now on")
+        return stats
@@ -0,0 +1,180 @@
+import json
+import logging
+import re
+import dateutil.parser
+from bs4 import BeautifulSoup
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # orjson is optional; the standard library parser gives the same result, only slower
+    _loads = json.loads
+
+ARTICLE_TYPES = {'Article', 'NewsArticle', 'ReportageNewsArticle', 'AnalysisNewsArticle', 'BlogPosting',
+                 'LiveBlogPosting', 'SportsArticle', 'OpinionNewsArticle', 'BackgroundNewsArticle'}
+# Keys that hold each field in __NEXT_DATA__ / Apollo payloads, most specific first
+TITLE_KEYS = ('headline', 'title', 'name')
+BODY_KEYS = ('articleBody', 'body', 'content', 'text', 'bodyHtml', 'html')
+DATE_KEYS = ('datePublished', 'publishedAt', 'published_at', 'publishDate', 'publishedDate', 'firstPublished',
+             'published', 'date', 'createdAt')
+AUTHOR_KEYS = ('author', 'authors', 'byline', 'creator')
+SECTION_KEYS = ('articleSection', 'section', 'category', 'sectionName')
+# Globals that server-rendered apps assign their state to
+STATE_GLOBALS = re.compile(r'window\.(?:__APOLLO_STATE__|__PRELOADED_STATE__|__INITIAL_STATE__)\s*=\s*')
+# Shortest text that counts as an article body rather than a teaser
+MIN_BODY_LENGTH = 200
+MAX_DEPTH = 12
+
+def _types(node):
+    value = node.get('@type')
+    return set(value) if isinstance(value, list) else {value}
+
+def _text(value):
+    """Plain text of a string, an HTML fragment or a list of rich-text blocks"""
+    if isinstance(value, str):
+        return BeautifulSoup(value, 'html.parser').get_text(' ', strip=True) if '<' in value else value.strip()
+    if isinstance(value, list):
+        return ' '.join(part for part in (_text(item) for item in value) if part)
+    if isinstance(value, dict):
+        for key in ('text', 'value', 'html', 'content', 'children'):
+            if key in value:
+                return _text(value[key])
+    return ''
+
+def _name(value):
+    if isinstance(value, str):
+        return value.strip() or None
+    if isinstance(value, list):
+        names = [name for name in (_name(item) for item in value) if name]
+        return ', '.join(names) or None
+    if isinstance(value, dict):
+        return _name(value.get('name') or value.get('displayName') or value.get('title'))
+    return None
+
+def _first(node, keys, convert):
+    for key in keys:
+        if node.get(key):
+            value = convert(node[key])
+            if value:
+                return value
+    return None
+
+def _parse_date(value):
+    if isinstance(value, (int, float)):
+        return None
+    try:
+        return dateutil.parser.parse(value)
+    except Exception:
+        return None
+
+def _to_article(node, origin):
+    article = {
+        'title': _first(node, TITLE_KEYS, _text),
+        'content': _first(node, BODY_KEYS, _text),
+        'published_at': _first(node, DATE_KEYS, _parse_date),
+        'author': _first(node, AUTHOR_KEYS, _name),
+        'section': _first(node, SECTION_KEYS, _name),
+        'origin': origin
+    }
+    return article if article['title'] else None
+
+def _walk(data, depth=0):
+    """Yield every dict in a JSON tree, down to MAX_DEPTH levels"""
+    if depth > MAX_DEPTH:
+        return
+    if isinstance(data, dict):
+        yield data
+        for value in data.values():
+            if isinstance(value, (dict, list)):
+                yield from _walk(value, depth + 1)
+    elif isinstance(data, list):
+        for item in data:
+            if isinstance(item, (dict, list)):
+                yield from _walk(item, depth + 1)
+
+def _from_json_ld(soup):
+    for script in soup.select('script[type="application/ld+json"]'):
+        try:
+            data = _loads(script.get_text())
+        except Exception:
+            continue
+        for node in _walk(data):
+            if _types(node) & ARTICLE_TYPES:
+                article = _to_article(node, 'json-ld')
+                if article:
+                    return article
+    return None
+
+def _looks_like_article(node):
+    if not any(isinstance(node.get(key), str) for key in TITLE_KEYS):
+        return False
+    return any(len(_text(node[key])) >= MIN_BODY_LENGTH for key in BODY_KEYS if node.get(key))
+
+def _from_app_state(data, origin):
+    """Pick the node with the longest body among those shaped like an article"""
+    best = None
+    for node in _walk(data):
+        if _looks_like_article(node):
+            article = _to_article(node, origin)
+            if article and (best is None or len(article['content'] or '') > len(best['content'] or '')):
+                best = article
+    return best
+
+def _from_next_data(soup):
+    script = soup.select_one('script#__NEXT_DATA__')
+    text = script.get_text() if script else None
+    if not text:
+        return None
+    try:
+        data = _loads(text)
+    except Exception:
+        return None
+    return _from_app_state(data.get('props', data), 'next-data')
+
+def _from_state_globals(soup):
+    decoder = json.JSONDecoder()
+    for script in soup.select('script:not([src])'):
+        text = script.get_text()
+        match = STATE_GLOBALS.search(text)
+        if not match:
+            continue
+        try:
+            data, _ = decoder.raw_decode(text, match.end())
+        except ValueError:
+            continue
+        article = _from_app_state(data, 'app-state')
+        if article:
+            return article
+    return None
+
+def _extract(soup):
+    merged = None
+    for extractor in (_from_json_ld, _from_next_data, _from_state_globals):
+        try:
+            article = extractor(soup)
+        except Exception as e:
+            logging.debug(f"Structured data extractor {extractor.__name__} failed: {str(e)}")
+            continue
+        if not article:
+            continue
+        if merged is None:
+            merged = article
+        else:
+            # JSON-LD often has the metadata but not the body; fill gaps from the app state
+            for key, value in article.items():
+                if not merged.get(key) and value:
+                    merged[key] = value
+        if merged['content'] and len(merged['content']) >= MIN_BODY_LENGTH and merged['published_at']:
+            break
+    return merged
+
+def extract_structured_data(soup):
+    """Article fields from JSON-LD, __NEXT_DATA__ or Apollo-style state blobs, merged in that order
+
+    Returns a dict with title, content, published_at (datetime), author, section and origin
+    (which blob supplied the title), or None when the page embeds no article data. The result
+    is kept on the parsed page, so readiness checks and extraction share one parse per page.
+    """
+    if '_structured_data' not in soup.__dict__:
+        soup._structured_data = _extract(soup)
+    return soup._structured_data
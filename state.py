@@ -0,0 +1,74 @@
+import atexit
+import json
+import logging
+import multiprocessing.util
+import os
+import threading
+from pathlib import Path
+
+# Local scraper state that survives between runs (fetch strategies, caches, indexes)
+STATE_DIR = Path(os.getenv("SCRAPER_STATE_DIR", Path(__file__).parent / ".scraper_state"))
+# Number of sources scraped in parallel worker processes (1 runs everything in the main process)
+SCRAPER_WORKERS = int(os.getenv("SCRAPER_WORKERS", "4"))
+
+def state_path(*parts):
+    """Path of a state file under STATE_DIR, creating its directory"""
+    path = STATE_DIR.joinpath(*parts)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path
+
+def load_json(path, default=None):
+    try:
+        with open(path, encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return default
+    except Exception as e:
+        logging.warning(f"Ignoring unreadable state file {path}: {str(e)}")
+        return default
+
+def save_json(path, data):
+    """Write JSON atomically so a killed run never leaves a half-written state file"""
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+class ProcessLocal:
+    """One object per process, built by factory on first use and rebuilt in a child process
+
+    Objects inherited from another process are never reused or closed here. With on_exit, the
+    object is passed to it when this process ends, then dropped.
+    """
+    def __init__(self, factory, on_exit=None):
+        self._factory = factory
+        self._on_exit = on_exit
+        self.reset()
+        if on_exit is not None:
+            atexit.register(self.close)
+            # Pool worker processes end with os._exit(), which skips atexit but runs multiprocessing finalizers
+            multiprocessing.util.Finalize(None, self.close, exitpriority=10)
+
+    def reset(self):
+        """Forget the current object without closing it (after a fork, where it belongs to the parent)"""
+        self._value = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        value = self._value
+        if value is not None and self._pid == os.getpid():
+            return value
+        with self._lock:
+            if self._value is None or self._pid != os.getpid():
+                self._value = self._factory()
+                self._pid = os.getpid()
+            return self._value
+
+    def close(self):
+        with self._lock:
+            if self._value is not None and self._pid == os.getpid() and self._on_exit is not None:
+                self._on_exit(self._value)
+            self._value = None
+            self._pid = None
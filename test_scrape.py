@@ -1,9 +1,7 @@
+import argparse
 import logging
-import json
-from pathlib import Path
 import sys
 import os
-import importlib
 from datetime import datetime, timedelta
 import random
 import requests
@@ -15,9 +13,8 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 # Sử dụng absolute import thay vì relative import
 from database import save_article, get_scraping_stats
 from utils import fetch_url
-from sources.skysports import scrape_all_articles as scrape_skysports
-from sources.cnbc import scrape_all_articles as scrape_cnbc
-from sources.vnexpress import scrape_all_articles as scrape_vnexpress
+from sources.registry import load_source_configs, open_scraper
+from page_store import set_page_store_mode, replaying
 
 # Cấu hình logging với UTF-8 encoding
 logging.basicConfig(
@@ -42,6 +39,9 @@ if sys.stdout.encoding != 'utf-8':
 
 def check_url_access(url):
     """Kiểm tra xem URL có truy cập được không"""
+    if replaying():
+        # Chế độ replay đọc trang từ kho lưu trữ, không cần mạng
+        return True
     try:
         logging.info(f"Kiểm tra URL: {url}")
         headers = {
@@ -66,12 +66,11 @@ def process_news_source(source_config):
 
     try:
         # Nhập module scraper tương ứng
-        logging.info(f"Nhập module: sources.{source_config['module']}")
-        module = importlib.import_module(f"sources.{source_config['module']}")
-
-        # Scrape tất cả bài báo để chọn ngẫu nhiên
-        logging.info(f"Scrape bài báo từ {source_config['name']} để kiểm tra ngẫu nhiên")
-        articles = module.scrape_all_articles()
+        logging.info(f"Nhập module: sources.{source_config.get('module', 'base_scraper')}")
+        with open_scraper(source_config) as scraper:
+            # Scrape tất cả bài báo để chọn ngẫu nhiên
+            logging.info(f"Scrape bài báo từ {source_config['name']} để kiểm tra ngẫu nhiên")
+            articles = scraper.scrape_all_articles()
 
         if not articles:
             logging.warning(f"Không tìm thấy bài báo nào cho {source_config['name']}")
@@ -135,10 +134,7 @@ def process_news_source(source_config):
 def run_scraper():
     try:
         # Tải cấu hình nguồn
-        config_path = Path(__file__).parent / "config.json"
-        logging.info(f"Tải cấu hình từ: {config_path}")
-        with open(config_path) as f:
-            sources = json.load(f)
+        sources = load_source_configs()
 
         logging.info(f"Tìm thấy {len(sources)} nguồn để xử lý")
 
@@ -162,12 +158,11 @@ def run_scraper():
 
             try:
                 # Nhập module scraper tương ứng
-                logging.info(f"Nhập module: sources.{source['module']}")
-                module = importlib.import_module(f"sources.{source['module']}")
-
-                # Scrape tất cả bài báo để chọn ngẫu nhiên
-                logging.info(f"Scrape bài báo từ {source['name']} để kiểm tra ngẫu nhiên")
-                articles = module.scrape_all_articles()
+                logging.info(f"Nhập module: sources.{source.get('module', 'base_scraper')}")
+                with open_scraper(source) as scraper:
+                    # Scrape tất cả bài báo để chọn ngẫu nhiên
+                    logging.info(f"Scrape bài báo từ {source['name']} để kiểm tra ngẫu nhiên")
+                    articles = scraper.scrape_all_articles()
 
                 if not articles:
                     logging.warning(f"Không tìm thấy bài báo nào cho {source['name']}")
@@ -214,4 +209,13 @@ def run_scraper():
         logging.error(f"Lỗi nghiêm trọng: {str(e)}")
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Kiểm tra scrape ngẫu nhiên 3 nguồn tin")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--record", action="store_true", help="lưu mọi trang tải về vào kho trang")
+    mode.add_argument("--replay", action="store_true", help="đọc trang từ kho trang thay vì tải từ mạng")
+    args = parser.parse_args()
+    if args.record:
+        set_page_store_mode("record")
+    elif args.replay:
+        set_page_store_mode("replay")
     run_scraper()
\ No newline at end of file
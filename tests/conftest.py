@@ -0,0 +1,35 @@
+import os
+import sys
+import tempfile
+from pathlib import Path
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+# Keep the tests' state (validator cache, fetch strategies, rate limits) out of the real state directory
+os.environ.setdefault("SCRAPER_STATE_DIR", tempfile.mkdtemp(prefix="scraper-tests-"))
+
+from sources.registry import load_source_configs, get_scraper_class
+
+# Every fast engine by name, so one that is not installed shows up as skipped rather than missing
+FAST_ENGINES = ('lxml', 'lexbor')
+ENGINE_MODULES = {'lexbor': 'selectolax'}
+
+@pytest.fixture(scope='session')
+def source_configs():
+    return {source['name']: source for source in load_source_configs()}
+
+@pytest.fixture
+def make_scraper(source_configs):
+    """Build a configured scraper for a source name, with config.json settings overridden by keyword"""
+    def build(name, **overrides):
+        config = dict(source_configs[name], **overrides)
+        scraper = get_scraper_class(config)()
+        scraper.apply_config(config)
+        return scraper
+    return build
+
+@pytest.fixture(params=FAST_ENGINES)
+def engine(request):
+    if request.param in ENGINE_MODULES:
+        pytest.importorskip(ENGINE_MODULES[request.param])
+    return request.param
@@ -0,0 +1,51 @@
+"""Synthetic pages shaped like the configured sources' listings and articles, and what a scraper reads from them"""
+import re
+
+def sky_sports_pages():
+    """A Sky Sports style listing and article page, padded with the scripts and chrome real pages carry"""
+    chrome = ''.join(f'<nav class="site-nav"><ul>{"".join(f"<li><a href=/nav/{i}>Item {i}</a></li>" for i in range(40))}</ul></nav>'
+                     f'<script>window.analytics_{j} = {{"events": [{", ".join(str(i) for i in range(400))}]}};</script>'
+                     f'<style>.x{j} {{ color: red; }}</style><svg><path d="{"M0 0 L1 1 " * 200}"/></svg>' for j in range(30))
+    cards = ''.join(f'<div class="news-list__item"><a href="/football/news/11095/{13000000 + i}/story-{i}">Story {i}</a>'
+                    f'<span class="news-list__meta"><time datetime="2025-01-01T10:00:00Z">1h</time></span></div>' for i in range(200))
+    body = ''.join(f'<p>Paragraph {i} of the match report describes what happened in detail.</p>' for i in range(60))
+    listing = f'<html><head><title>Football news</title></head><body>{chrome}<main>{cards}</main>{chrome}</body></html>'
+    article = (f'<html><head><title>Report</title><meta property="article:published_time" content="2025-01-01T10:00:00Z">'
+               f'<script type="application/ld+json">{{"@type": "NewsArticle", "headline": "Report"}}</script></head>'
+               f'<body>{chrome}<div class="sdc-article-body article__body"><h1 class="article__headline">Report of the weekend match</h1>'
+               f'<time datetime="2025-01-01T10:00:00Z">1h</time>{body}</div>{chrome}</body></html>')
+    return [('Sky Sports', 'https://www.skysports.com/football/news/', listing),
+            ('Sky Sports', 'https://www.skysports.com/football/news/11095/13000001/story-1', article)]
+
+def cnbc_listing():
+    """A CNBC style listing: River and Card markup among a few thousand elements of page chrome"""
+    banner = ''.join(f'<li class="MarketsBanner-item"><span class="MarketCard-symbol">S{j}</span>'
+                     f'<span class="MarketCard-changes">+0.{j}%</span></li>' for j in range(10))
+    chrome = ''.join(f'<div class="PageBuilder-col-{i % 12} PageBuilder-containerFluidWidths">'
+                     f'<ul class="MarketsBanner-list">{banner}</ul></div>' for i in range(60))
+    cards = ''.join(f'<div class="Card-standardBreakerCard Card-card Card-rectangleToLeftSquareMedia"><div class="Card-cardInfo">'
+                    f'<div class="Card-titleContainer"><a class="Card-title" href="https://www.cnbc.com/sports/2025/01/01/story-{i}.html">'
+                    f'<div>Story {i}</div></a></div><span class="Card-time">{i % 5 + 1} hours ago</span></div>'
+                    f'<div class="Card-mediaContainer"><img class="Card-mediaImage" src="/img/{i}.jpg"></div></div>'
+                    f'<div class="RiverPlusCard-container"><div class="RiverHeadline-headline RiverHeadline-hasThumbnail">'
+                    f'<a href="https://www.cnbc.com/sports/2025/01/01/river-{i}.html">River {i}</a></div></div>' for i in range(120))
+    html = f'<html><head><title>Sports</title></head><body>{chrome}<div class="PageBuilder-pageWrapper">{cards}</div>{chrome}</body></html>'
+    return [('CNBC', 'https://www.cnbc.com/sports/', html)]
+
+def archived_pages(source_names, limit=20):
+    """Newest recorded pages of the configured sources, when a page store exists"""
+    try:
+        from page_store import PageStore
+        return [(source, url, html) for url, source, html in PageStore().latest_pages(None, limit) if source in source_names]
+    except Exception:
+        return []
+
+def extract(scraper, url, html):
+    """What a scraper takes from one page: (link, card date) of its cards, or the fields of its article"""
+    if not re.match(scraper.article_url_pattern, url):
+        document = scraper.make_document(html, True)
+        return [(href, scraper.card_published_at(card)) for href, card in scraper.listing_links(document)]
+    # Served to _get_soup() as an already downloaded page, so nothing goes over the network
+    scraper._prefetched[url] = html
+    article = scraper.scrape_article_content(url) or {}
+    return tuple(article.get(field) for field in ('title', 'content', 'published_at'))
@@ -0,0 +1,40 @@
+"""Every fast HTML engine must extract exactly what BeautifulSoup extracts"""
+import pytest
+from bs4 import BeautifulSoup
+from conftest import FAST_ENGINES
+from pages import archived_pages, cnbc_listing, extract, sky_sports_pages
+from sources.html_engine import ENGINES, parse_document
+from sources.registry import load_source_configs
+
+# Whitespace-only and empty strings between elements, where get_text(' ', strip=True) is easy to get wrong
+TEXT_FIXTURES = [
+    '<div><p>a</p>  <p> </p><p>b <i>c</i></p>\n<span></span>d</div>',
+    '<div> x <b> </b> y </div>',
+    '<div><!-- comment --><p>q</p>\t\n</div>',
+    '<div>a&nbsp;<b>b</b><p>&nbsp;</p>z</div>',
+    '<div></div>',
+    '<div>Score <script>var x = 1;</script> 2 - 1 <style>p { }</style></div>',
+    '<div><h1> Title </h1>\n\n<div class="byline">  By <a href="/a">Reporter</a> </div></div>',
+]
+
+# Relative card dates ("2 hours ago") are read against the scraper's clock, so both runs share one
+CLOCK = 1735725600
+PAGES = sky_sports_pages() + cnbc_listing() + archived_pages({source['name'] for source in load_source_configs()})
+
+def test_every_installed_engine_is_tested():
+    assert set(ENGINES) <= set(FAST_ENGINES)
+
+@pytest.mark.parametrize('source, url, html', PAGES, ids=[url for _, url, _ in PAGES])
+def test_extraction_matches_soup(make_scraper, engine, source, url, html):
+    soup_scraper, engine_scraper = make_scraper(source, engine='soup'), make_scraper(source, engine=engine)
+    for scraper in (soup_scraper, engine_scraper):
+        scraper.set_clock(CLOCK)
+    expected = extract(soup_scraper, url, html)
+    assert expected and any(expected)
+    assert extract(engine_scraper, url, html) == expected
+
+@pytest.mark.parametrize('html', TEXT_FIXTURES)
+@pytest.mark.parametrize('separator', [' ', '\n', ''])
+def test_get_text_matches_soup(engine, html, separator):
+    expected = BeautifulSoup(html, 'lxml').select_one('div').get_text(separator, strip=True)
+    assert parse_document(html, engine).select_one('div').get_text(separator, strip=True) == expected
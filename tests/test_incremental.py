@@ -0,0 +1,66 @@
+"""Section marks and listing validators are only kept for sections whose articles all went through"""
+import re
+import pytest
+import sources.base_scraper as base_scraper
+from http_cache import ValidatorCache
+from pages import sky_sports_pages
+
+LISTING_URL = 'https://www.skysports.com/football/news/'
+
+class FakeResponse:
+    def __init__(self, text):
+        self.text = text
+        self.status_code = 200
+        self.headers = {'ETag': '"v1"'}
+
+    def raise_for_status(self):
+        pass
+
+class FakeSession:
+    """Answers listing URLs with the synthetic listing and article URLs with the synthetic article"""
+    def __init__(self):
+        (_, _, self.listing), (_, _, self.article) = sky_sports_pages()
+
+    def get(self, url, headers=None, timeout=None, **kwargs):
+        return FakeResponse(self.article if re.search(r'/\d{8}/', url) else self.listing)
+
+    def close(self):
+        pass
+
+@pytest.fixture
+def validators(monkeypatch):
+    cache = ValidatorCache()
+    monkeypatch.setattr(base_scraper, 'get_validator_cache', lambda: cache)
+    return cache
+
+@pytest.fixture
+def saved_marks(monkeypatch):
+    saved = {}
+    monkeypatch.setattr(base_scraper, 'get_seen_index', lambda: set())
+    monkeypatch.setattr(base_scraper, 'get_section_marks', lambda source: {})
+    monkeypatch.setattr(base_scraper, 'update_section_marks', lambda source, marks: saved.update(marks) or True)
+    return saved
+
+@pytest.fixture
+def scraper(make_scraper):
+    scraper = make_scraper('Sky Sports', sections=['/football/news/'], feeds=[], fetch_mode='static', date_bounded=False)
+    scraper.session = FakeSession()
+    scraper.prefetch_window = 0
+    scraper.max_links_to_crawl = 5
+    scraper._rate_limit = lambda url: None
+    return scraper
+
+def test_interrupted_section_keeps_no_marks_or_validators(scraper, saved_marks, validators):
+    articles = scraper.iter_articles()
+    next(articles)
+    next(articles)
+    articles.close()
+    scraper.save_section_marks()
+    assert saved_marks == {}
+    assert validators.conditional_headers(LISTING_URL) == {}
+
+def test_finished_section_keeps_marks_and_validators(scraper, saved_marks, validators):
+    assert len(list(scraper.iter_articles())) == 5
+    scraper.save_section_marks()
+    assert saved_marks[LISTING_URL]['links'][0] == 'https://www.skysports.com/football/news/11095/13000000/story-0'
+    assert validators.conditional_headers(LISTING_URL) == {'If-None-Match': '"v1"'}
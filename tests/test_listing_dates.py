@@ -0,0 +1,32 @@
+"""Publication times read from listing cards"""
+from datetime import datetime, timezone
+import pytest
+from bs4 import BeautifulSoup
+from sources.listing_dates import card_timestamp
+
+NOW = datetime(2025, 1, 5, 12, 0, tzinfo=timezone.utc)
+
+def _card(html):
+    return BeautifulSoup(f'<div class="card">{html}</div>', 'lxml').select_one('.card')
+
+@pytest.mark.parametrize('html, expected', [
+    ('<time datetime="2025-01-01T10:00:00Z">1h</time>', datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)),
+    ('<span data-date="2025-01-01 10:00">Jan 1</span>', datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)),
+    ('<span data-date="20250101">Jan 1</span>', datetime(2025, 1, 1, tzinfo=timezone.utc)),
+    ('<span data-date="202501011030">Jan 1</span>', datetime(2025, 1, 1, 10, 30, tzinfo=timezone.utc)),
+    ('<span data-timestamp="1735725600">Jan 1</span>', datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)),
+    ('<span data-timestamp="1735725600000">Jan 1</span>', datetime(2025, 1, 1, 10, 0, tzinfo=timezone.utc)),
+    ('<span class="card-time">3 hours ago</span>', datetime(2025, 1, 5, 9, 0, tzinfo=timezone.utc)),
+    ('<time>45 mins ago</time>', datetime(2025, 1, 5, 11, 15, tzinfo=timezone.utc)),
+])
+def test_card_timestamp(html, expected):
+    assert card_timestamp(_card(html), NOW) == expected
+
+@pytest.mark.parametrize('html', [
+    '<a href="/story">No date here</a>',
+    # Digits that are neither a compact date nor an epoch are not taken for a 1970s timestamp
+    '<span data-date="2025">2025</span>',
+    '<span data-date="20251399">?</span>',
+])
+def test_card_without_a_date(html):
+    assert card_timestamp(_card(html), NOW) is None
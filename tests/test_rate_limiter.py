@@ -0,0 +1,18 @@
+"""Token buckets of the shared rate limiter"""
+import importlib
+import sys
+import rate_limiter
+
+def test_rate_limiter_works_without_fcntl(monkeypatch):
+    # Windows has no fcntl; the limiter then only locks within the process
+    monkeypatch.setitem(sys.modules, 'fcntl', None)
+    try:
+        limiter_module = importlib.reload(rate_limiter)
+        assert limiter_module.fcntl is None
+        limiter = limiter_module.RateLimiter()
+        limiter.configure('no-fcntl.example', rate=10, burst=2)
+        waits = [limiter._reserve('no-fcntl.example') for _ in range(3)]
+        assert waits[:2] == [0.0, 0.0] and waits[2] > 0
+    finally:
+        monkeypatch.undo()
+        importlib.reload(rate_limiter)
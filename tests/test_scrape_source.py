@@ -0,0 +1,32 @@
+"""A source's run in scrape_source(): time budget and scraper teardown"""
+import time
+from contextlib import contextmanager
+import main
+
+class SlowClosingScraper:
+    def __init__(self):
+        self.closed = False
+
+    def iter_articles(self):
+        yield {'title': 'Title', 'url': 'https://example.com/news/1'}
+
+    def close(self):
+        time.sleep(1.5)
+        self.closed = True
+
+def test_budget_does_not_interrupt_close(monkeypatch):
+    scraper = SlowClosingScraper()
+
+    @contextmanager
+    def open_scraper(source):
+        try:
+            yield scraper
+        finally:
+            scraper.close()
+    monkeypatch.setattr(main, 'open_scraper', open_scraper)
+    monkeypatch.setattr(main, 'save_articles', lambda batch: {'inserted': len(batch), 'duplicates': 0, 'failed': 0})
+    monkeypatch.setattr(main, 'update_scrape_time', lambda name: None)
+    # The budget runs out while close() is still quitting browsers and saving state
+    result = main.scrape_source({'name': 'Example', 'id': 'example', 'time_budget': 1})
+    assert scraper.closed
+    assert result['status'] == 'ok' and result['saved'] == 1
@@ -0,0 +1,40 @@
+"""Articles taken straight from embedded JSON-LD instead of the DOM"""
+import json
+from datetime import datetime, timezone
+
+URL = 'https://www.skysports.com/football/news/11095/13000002/arsenal-win-derby'
+BODY = ("Arsenal produced their best performance of the season to beat Tottenham 3-1 in the north London derby on Sunday. "
+        "Bukayo Saka opened the scoring after twelve minutes before Martin Odegaard doubled the lead from the edge of the box. "
+        "Son Heung-min pulled one back early in the second half, but Kai Havertz settled the game with a late header.")
+
+def _article_page(body=BODY):
+    data = {
+        '@context': 'https://schema.org',
+        '@type': 'NewsArticle',
+        'headline': 'Arsenal 3-1 Tottenham: Saka, Odegaard and Havertz win the derby',
+        'articleBody': body,
+        'datePublished': '2025-01-05T18:30:00Z',
+        'author': {'@type': 'Person', 'name': 'Sky Sports News'},
+        'articleSection': 'Football',
+    }
+    # The DOM holds only a stub, so a result with the full body can only have come from the JSON-LD
+    return (f'<html><head><title>Arsenal 3-1 Tottenham</title>'
+            f'<script type="application/ld+json">{json.dumps(data)}</script></head>'
+            f'<body><div class="article__body"><h1 class="article__headline">Arsenal win the derby</h1><p>x</p></div></body></html>')
+
+def test_json_ld_article_is_used(make_scraper):
+    scraper = make_scraper('Sky Sports')
+    scraper._prefetched[URL] = _article_page()
+    article = scraper.scrape_article_content(URL)
+    assert article['title'] == 'Arsenal 3-1 Tottenham: Saka, Odegaard and Havertz win the derby'
+    assert article['content'] == BODY
+    assert article['published_at'] == datetime(2025, 1, 5, 18, 30, tzinfo=timezone.utc)
+    assert scraper.fetch_stats['structured'] == 1
+
+def test_json_ld_article_is_validated_when_the_profile_asks(make_scraper, source_configs):
+    config = source_configs['Sky Sports']
+    scraper = make_scraper('Sky Sports', article=dict(config['article'], validate=True))
+    scraper._prefetched[URL] = _article_page()
+    # "best" is one of validate_article()'s spam words, and the stub DOM fails validation as well
+    assert scraper.scrape_article_content(URL) is None
+    assert scraper.fetch_stats['structured'] == 0
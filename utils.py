@@ -6,6 +6,9 @@ import requests
 from bs4 import BeautifulSoup
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
+from rate_limiter import get_rate_limiter, domain_of
+from http_cache import get_validator_cache
+from page_store import replaying, record_page, replay_page
 
 logging.basicConfig(
     level=logging.INFO,
@@ -14,24 +17,21 @@ logging.basicConfig(
 )
 
 def rate_limit(seconds):
+    """Pace calls whose first argument is a URL through the shared per-domain limiter, at most one per `seconds`"""
     def decorator(func):
-        last_called = {}
         @wraps(func)
-        def wrapper(*args, **kwargs):
-            current_time = time.time()
-            if func.__name__ not in last_called or \
-               current_time - last_called[func.__name__] >= seconds:
-                last_called[func.__name__] = current_time
-                return func(*args, **kwargs)
-            else:
-                time.sleep(seconds - (current_time - last_called[func.__name__]))
-                last_called[func.__name__] = time.time()
-                return func(*args, **kwargs)
+        def wrapper(url, *args, **kwargs):
+            limiter = get_rate_limiter()
+            domain = domain_of(url)
+            if not limiter.is_configured(domain):
+                limiter.configure(domain, rate=1 / seconds, burst=1, max_rate=1 / seconds)
+            limiter.acquire(url)
+            return func(url, *args, **kwargs)
         return wrapper
     return decorator
 
-def fetch_url(url, max_retries=3, retry_delay=1):
-    """Fetch URL with retry mechanism and proper headers"""
+def fetch_url(url, max_retries=3, retry_delay=1, conditional=False):
+    """Fetch URL with retry mechanism and proper headers; with conditional=True an unchanged page returns None"""
     headers = {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
@@ -46,22 +46,37 @@ def fetch_url(url, max_retries=3, retry_delay=1):
         'Sec-Fetch-User': '?1',
         'Cache-Control': 'max-age=0'
     }
+    if conditional:
+        headers.update(get_validator_cache().conditional_headers(url))
+    if replaying():
+        html = replay_page(url)
+        return BeautifulSoup(html, 'lxml') if html is not None else None
 
     for attempt in range(max_retries):
         try:
             logging.info(f"Fetching URL: {url} (attempt {attempt + 1}/{max_retries})")
+            get_rate_limiter().acquire(url)
             response = requests.get(url, headers=headers, timeout=10, verify=False)
+            get_rate_limiter().record(url, response.status_code, response.headers.get('Retry-After'))
             
             # Log response details
             logging.info(f"Response status: {response.status_code}")
             logging.info(f"Response headers: {dict(response.headers)}")
             
+            if response.status_code == 304:
+                get_validator_cache().touch(url)
+                logging.info(f"Not modified since last fetch: {url}")
+                return None
+
             if response.status_code == 403:
                 logging.error(f"Access forbidden (403) for URL: {url}")
                 logging.error(f"Response content: {response.text[:500]}...")  # Log first 500 chars
                 return None
                 
             response.raise_for_status()
+            if conditional:
+                get_validator_cache().remember(url, response.headers)
+            record_page(url, response.text)
             
             # Check if content is JavaScript-rendered
             content_type = response.headers.get('Content-Type', '')
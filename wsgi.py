@@ -1,5 +1,5 @@
 from flask import Flask, jsonify
-from database import get_db, get_scraping_stats
+from database import get_db, get_scraping_stats, get_pool_health
 import logging
 
 app = Flask(__name__)
@@ -18,6 +18,11 @@ logging.basicConfig(
 def health_check():
     return jsonify({"status": "healthy"})
 
+@app.route('/health/db')
+def db_health():
+    health = get_pool_health()
+    return jsonify(health), 200 if health["status"] == "healthy" else 503
+
 @app.route('/stats')
 def get_stats():
     try: